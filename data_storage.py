@@ -15,13 +15,257 @@ Example:
     >>> all_metrics = storage.get_metrics_by_time_range(start_time, end_time)
 """
 
+import heapq
+import logging
+import queue
 import sqlite3
+import sys
 import threading
-from datetime import datetime
-from typing import List, Optional, Tuple
+import time
+import zlib
+from datetime import datetime, timedelta
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
 from resource_collector import ResourceMetrics
 
+logger = logging.getLogger(__name__)
+
+
+# Schema version stored in PRAGMA user_version. Version 1 stores timestamps
+# as INTEGER microseconds since the Unix epoch instead of ISO-8601 TEXT;
+# version 2 stores every metric as a fixed-point INTEGER (see _SCALES);
+# version 3 makes resource_metrics a WITHOUT ROWID table keyed on timestamp.
+_SCHEMA_VERSION = 3
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch.
+    
+    A naive wall-clock value is stored as-is (no local/UTC conversion), so the
+    round trip through _from_epoch_us() is exact. Timezone-aware values are
+    first converted to naive local time, the clock datetime.now() and the
+    collector use; they come back naive.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_epoch_us(value: int) -> datetime:
+    """Convert integer microseconds since the Unix epoch back to a datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _encode_metrics(metrics: ResourceMetrics) -> tuple:
+    """Convert a ResourceMetrics object to the fixed-point row stored on disk."""
+    return (
+        _to_epoch_us(metrics.timestamp),
+        round(metrics.cpu_percent * 100),
+        round(metrics.memory_percent * 100),
+        round(metrics.memory_used_mb * 100),
+        round(metrics.memory_total_mb * 100),
+        round(metrics.disk_percent * 100),
+        round(metrics.disk_used_gb * 1000),
+        round(metrics.disk_total_gb * 1000),
+        round(metrics.network_sent_mb * 1000),
+        round(metrics.network_recv_mb * 1000),
+        round(metrics.network_sent_rate_mbps * 1000),
+        round(metrics.network_recv_rate_mbps * 1000)
+    )
+
+
+# Metric columns in ResourceMetrics field order
+_COLUMNS = (
+    'timestamp', 'cpu_percent', 'memory_percent',
+    'memory_used_mb', 'memory_total_mb',
+    'disk_percent', 'disk_used_gb', 'disk_total_gb',
+    'network_sent_mb', 'network_recv_mb',
+    'network_sent_rate_mbps', 'network_recv_rate_mbps'
+)
+_SELECT_COLUMNS = ", ".join(_COLUMNS)
+
+# Columns charted by the GUI, aggregated by get_downsampled() and
+# get_aggregates_by_time_range()
+_CHARTED_COLUMNS = (
+    'timestamp', 'cpu_percent', 'memory_percent', 'disk_percent',
+    'network_sent_rate_mbps', 'network_recv_rate_mbps'
+)
+
+# Fixed-point scale of each stored column: percentages keep 0.01%, MB values
+# 0.01 MB, GB values 1 MB, cumulative network MB 1 KB and rates 1 kbps.
+# SQLite stores small integers in 1-4 bytes instead of 8 for a REAL.
+_SCALES = (1, 100, 100, 100, 100, 100, 1000, 1000, 1000, 1000, 1000, 1000)
+_SCALE_BY_COLUMN = dict(zip(_COLUMNS, _SCALES))
+
+# Used by _encode_metrics_batch() to scale a whole batch at once
+_METRIC_VALUES = attrgetter(*_COLUMNS[1:])
+_METRIC_SCALES = np.array(_SCALES[1:], dtype=np.float64)
+
+
+def _encode_metrics_batch(metrics_list: Sequence[ResourceMetrics]) -> List[tuple]:
+    """Encode many ResourceMetrics at once; same rows as _encode_metrics().
+    
+    The metric fields are read with one C-level attrgetter call per record
+    and scaled and rounded as a single NumPy array (np.rint rounds half to
+    even, like round()), which beats per-field round() calls for batches.
+    """
+    if not metrics_list:
+        return []
+    encoded = np.empty((len(metrics_list), len(_COLUMNS)), dtype=np.int64)
+    values = np.array([_METRIC_VALUES(m) for m in metrics_list], dtype=np.float64)
+    encoded[:, 0] = [_to_epoch_us(m.timestamp) for m in metrics_list]
+    encoded[:, 1:] = np.rint(values * _METRIC_SCALES, out=values)
+    return list(map(tuple, encoded.tolist()))
+
+# Record layout returned by get_metrics_numpy()
+METRICS_DTYPE = np.dtype(
+    [('timestamp', 'datetime64[us]')] + [(name, 'f4') for name in _COLUMNS[1:]]
+)
+
+# Kept as a single module-level string so sqlite3's per-connection statement
+# cache hands back the already-compiled statement on every insert. The table
+# is keyed on timestamp, so a sample saved twice is stored once.
+_INSERT_SQL = """
+    INSERT OR IGNORE INTO resource_metrics (
+        timestamp, cpu_percent, memory_percent,
+        memory_used_mb, memory_total_mb,
+        disk_percent, disk_used_gb, disk_total_gb,
+        network_sent_mb, network_recv_mb,
+        network_sent_rate_mbps, network_recv_rate_mbps
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Read-path statements built from the column lists once at import; f-strings
+# inside the methods would build a new SQL string (and hash it for the
+# statement cache lookup) on every call
+_SELECT_LATEST_SQL = f"""
+    SELECT {_SELECT_COLUMNS} FROM resource_metrics
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+_SELECT_BUCKET_SQL = f"""
+    SELECT {_SELECT_COLUMNS} FROM resource_metrics
+    WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp
+"""
+# Archive segments overlapping a time range, in time order either way
+_ARCHIVE_RANGE_SQL = """
+    SELECT row_count, data FROM resource_metrics_archive
+    WHERE last_timestamp >= ? AND first_timestamp <= ?
+    ORDER BY bucket_start
+"""
+_ARCHIVE_RANGE_DESC_SQL = _ARCHIVE_RANGE_SQL + " DESC"
+# SQLite only answers MIN()/MAX() with a single B-tree seek when it is the
+# sole aggregate of its SELECT, so oldest and newest are separate subqueries
+_OLDEST_SQL = """
+    SELECT MIN(ts) FROM (
+        SELECT MIN(timestamp) AS ts FROM resource_metrics
+        UNION ALL
+        SELECT MIN(first_timestamp) FROM resource_metrics_archive
+    )
+"""
+_NEWEST_SQL = """
+    SELECT MAX(ts) FROM (
+        SELECT MAX(timestamp) AS ts FROM resource_metrics
+        UNION ALL
+        SELECT MAX(last_timestamp) FROM resource_metrics_archive
+    )
+"""
+_STATISTICS_SQL = f"""
+    SELECT ({_OLDEST_SQL}), ({_NEWEST_SQL}),
+           (SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size())
+"""
+_DOWNSAMPLE_SQL = f"""
+    SELECT (timestamp - ?) / ? AS bucket, COUNT(*),
+           {", ".join(f"SUM({name}), MAX({name})" for name in _CHARTED_COLUMNS[1:])}
+    FROM resource_metrics
+    WHERE timestamp BETWEEN ? AND ?
+    GROUP BY bucket
+"""
+_AGGREGATE_SQL = f"""
+    SELECT COUNT(*),
+           {", ".join(f"SUM({name}), MIN({name}), MAX({name})" for name in _CHARTED_COLUMNS[1:])}
+    FROM resource_metrics
+    WHERE timestamp BETWEEN ? AND ?
+"""
+
+# Page size for new databases. Rows are small and mostly scanned in
+# timestamp order, so larger pages mean fewer B-tree levels and page reads.
+_PAGE_SIZE = 8192
+
+# Memory-mapped I/O limit per connection. Reads through the mapping skip a
+# read() syscall and copy per page; 32-bit builds keep a smaller window so
+# the mapping cannot exhaust their address space.
+_MMAP_SIZE = 2**30 if sys.maxsize > 2**32 else 2**28
+
+# Per-connection settings, run as one script when a connection is opened.
+# journal_mode=WAL is persistent and set once in _initialize_database().
+# mmap and a 128 MiB page cache let the large range scans behind history
+# charts avoid read() copies.
+_PRAGMA_SCRIPT = f"""
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size={_MMAP_SIZE};
+    PRAGMA cache_size=-131072;
+"""
+
+# Bounds used in place of a missing start or end time, so range queries
+# always bind the same parameters
+_MIN_TIMESTAMP = -2**63
+_MAX_TIMESTAMP = 2**63 - 1
+
+# How often the background thread checks for rows to move to the archive
+_ARCHIVE_CHECK_INTERVAL = 60.0
+
+# Queued by close() to stop the writer thread
+_STOP = object()
+
+
+@lru_cache(maxsize=None)
+def _range_sql(columns: str, descending: bool = False) -> str:
+    """Return the (cached) time-range SELECT for a comma-separated column list."""
+    order = "DESC" if descending else "ASC"
+    return (
+        f"SELECT {columns} FROM resource_metrics "
+        f"WHERE timestamp BETWEEN ? AND ? ORDER BY timestamp {order} LIMIT ?"
+    )
+
+
+def _archived_timestamps(conn: sqlite3.Connection, start: int, end: int) -> set:
+    """Return the archived epoch-µs timestamps between start and end (inclusive).
+    
+    Only segments overlapping the range are decoded, so this is a single
+    archive-table query when the range is newer than everything archived.
+    """
+    stamps = set()
+    for count, data in conn.execute(_ARCHIVE_RANGE_SQL, (start, end)):
+        stamps.update(_unpack_segment(data, count)[:, 0].tolist())
+    return stamps
+
+
+def _pack_segment(rows: np.ndarray) -> bytes:
+    """Compress an (n, 12) int64 block of stored rows into an archive blob.
+    
+    Each column is delta-encoded and the columns are laid out one after
+    another, so slowly changing series become long runs of small values that
+    zlib compresses well. The encoding is lossless on the fixed-point values.
+    """
+    deltas = np.diff(rows, axis=0, prepend=np.zeros((1, rows.shape[1]), np.int64))
+    return zlib.compress(np.ascontiguousarray(deltas.T).tobytes())
+
+
+def _unpack_segment(blob: bytes, count: int) -> np.ndarray:
+    """Decode an archive blob produced by _pack_segment() back to (n, 12) rows."""
+    deltas = np.frombuffer(zlib.decompress(blob), dtype=np.int64)
+    return np.cumsum(deltas.reshape(len(_COLUMNS), count), axis=1).T
 
 class ResourceDataStorage:
     """Handles persistent storage of resource metrics in SQLite database.
@@ -29,10 +273,11 @@ class ResourceDataStorage:
     This class provides thread-safe database operations for storing and retrieving
     resource metrics. It uses SQLite for lightweight, file-based storage with
     automatic schema creation and indexing for optimal query performance.
+    Only writes are serialized in Python; queries run on pooled read-only
+    connections and proceed in parallel with the writer under WAL.
     
     Attributes:
         db_path (str): Path to the SQLite database file.
-        lock (threading.Lock): Thread lock for ensuring thread-safe operations.
     
     Example:
         >>> storage = ResourceDataStorage("metrics.db")
@@ -44,136 +289,403 @@ class ResourceDataStorage:
         >>> results = storage.get_metrics_by_time_range(start, end)
     """
     
-    def __init__(self, db_path: str = "resource_monitor.db") -> None:
+    def __init__(
+        self,
+        db_path: str = "resource_monitor.db",
+        read_pool_size: int = 2,
+        flush_interval: float = 2.0,
+        flush_batch_size: int = 128,
+        archive_after: Optional[timedelta] = None
+    ) -> None:
         """Initialize the database storage.
         
         Creates or connects to an SQLite database file and initializes the schema
         if it doesn't already exist. An index on the timestamp column is created
         automatically for faster time-range queries.
         
+        Connections are opened once and kept for the lifetime of the storage
+        object: a single writer connection guarded by ``_write_lock`` and a small pool
+        of read-only connections used by the query methods.
+        
         Args:
             db_path: Path to the SQLite database file. If the file doesn't exist,
                 it will be created. Default is "resource_monitor.db".
+            read_pool_size: Number of read-only connections kept in the reader
+                pool. Default is 2.
+            flush_interval: Maximum time in seconds that metrics passed to
+                save_metrics() stay buffered before being written. Default is 2.0.
+            flush_batch_size: Number of buffered metrics that triggers an
+                early flush. Default is 128.
+            archive_after: If set, the background thread periodically moves
+                rows older than this into the compressed archive with
+                archive_metrics(). Default is None (no automatic archiving).
         
         Raises:
             sqlite3.Error: If database initialization fails.
         """
         self.db_path = db_path
-        self.lock = threading.Lock()
+        # Serializes use of the single writer connection only; readers use
+        # the pool and rely on WAL for isolation, so they never take it
+        self._write_lock = threading.Lock()
+        
+        # Cached get_metrics_count() result, adjusted by our own writes and
+        # dropped when another connection commits (seen via data_version)
+        self._count_lock = threading.Lock()
+        self._row_count: Optional[int] = None
+        self._count_generation = 0
+        self._data_version = None
+        # Rows added (or removed, if negative) by the open write transaction
+        self._row_delta = 0
+        # (write generation, count, result) of the last get_latest_metrics()
+        self._latest_cache: Optional[Tuple[int, int, List[ResourceMetrics]]] = None
+        
+        self._writer = self._connect()
         self._initialize_database()
+        
+        self._read_pool_size = max(1, read_pool_size)
+        self._readers: queue.Queue = queue.Queue()
+        for _ in range(self._read_pool_size):
+            self._readers.put(self._connect(read_only=True))
+        
+        # save_metrics() only enqueues; a dedicated writer thread drains the
+        # queue in batches so callers never wait on disk I/O
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self.archive_after = archive_after
+        self._next_archive = time.monotonic()
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open and configure a new SQLite connection.
+        
+        Args:
+            read_only: If True, the database is opened with ``mode=ro`` so the
+                connection can never take the write lock.
+        
+        Returns:
+            sqlite3.Connection: A configured connection returning plain tuples.
+        """
+        if read_only:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(
+                uri, uri=True, check_same_thread=False, cached_statements=256
+            )
+        else:
+            # The writer runs in autocommit mode; _get_connection issues
+            # BEGIN/COMMIT itself so transactions are explicit
+            conn = sqlite3.connect(
+                self.db_path, check_same_thread=False,
+                isolation_level=None, cached_statements=256
+            )
+        conn.executescript(_PRAGMA_SCRIPT)
+        return conn
     
     @contextmanager
-    def _get_connection(self):
-        """Context manager for thread-safe database connections.
+    def _get_connection(self, write: bool = False):
+        """Context manager that checks out one of the persistent connections.
         
-        Yields a database connection with automatic transaction management.
-        Commits on successful completion, rolls back on exception, and always
-        closes the connection.
+        Write operations use the single writer connection, serialized by
+        ``_write_lock``; the transaction is opened with BEGIN IMMEDIATE so the write
+        lock is taken upfront, committed on success and rolled back on
+        exception. Read operations first flush any buffered metrics, then
+        borrow a connection from the reader pool and return it afterwards, so
+        queries see every saved record and can run alongside the writer.
+        
+        Args:
+            write: If True, yield the writer connection. Default is False.
         
         Yields:
-            sqlite3.Connection: A database connection with Row factory enabled.
+            sqlite3.Connection: A database connection.
         
         Raises:
             sqlite3.Error: If connection or transaction operations fail.
         """
-        with self.lock:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row
+        if write:
+            with self._write_lock:
+                conn = self._writer
+                conn.execute("BEGIN IMMEDIATE")
+                self._row_delta = 0
+                try:
+                    yield conn
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    self._adjust_row_count(None)
+                    raise
+                # Applied only once readers can see the change
+                self._adjust_row_count(self._row_delta)
+        else:
+            if self._write_queue.unfinished_tasks:
+                self.flush()
+            conn = self._readers.get()
             try:
                 yield conn
-                conn.commit()
-            except Exception:
-                conn.rollback()
-                raise
             finally:
-                conn.close()
+                self._readers.put(conn)
+    
+    def close(self) -> None:
+        """Flush buffered metrics and close every database connection.
+        
+        Stops the background writer thread once it has written everything
+        queued before the call, then closes the writer and all pooled reader
+        connections. The storage object must not be used after it has been
+        closed.
+        """
+        self._write_queue.put(_STOP)
+        self._writer_thread.join(timeout=2.0)
+        self.flush()
+        with self._write_lock:
+            self._writer.close()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
     
     def _initialize_database(self) -> None:
         """Create the database schema and indexes if they don't exist.
         
-        Creates the resource_metrics table with all required columns and an
-        index on the timestamp column for optimized time-range queries.
+        Creates the resource_metrics table with all required columns,
+        clustered on the timestamp for optimized time-range queries. The
+        database is switched to WAL journal mode so readers can run while the
+        collector is writing; this setting persists in the database file.
+        
+        Databases written by older versions (ISO-8601 TEXT timestamps) are
+        migrated in place to the current schema, which is tracked through
+        ``PRAGMA user_version``.
+        
+        New databases are created with 8 KiB pages and incremental
+        auto-vacuum so pages freed by deletes can be released without
+        rewriting the whole file.
         
         Raises:
-            sqlite3.Error: If schema creation fails.
+            sqlite3.Error: If schema creation or migration fails.
         """
-        with self._get_connection() as conn:
+        # None of these can be changed inside a transaction; page_size and
+        # auto_vacuum only take effect before the first table is created (or
+        # on compact())
+        with self._write_lock:
+            self._writer.execute(f"PRAGMA page_size={_PAGE_SIZE}")
+            self._writer.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            self._writer.execute("PRAGMA journal_mode=WAL")
+        
+        with self._get_connection(write=True) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS resource_metrics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    cpu_percent REAL NOT NULL,
-                    memory_percent REAL NOT NULL,
-                    memory_used_mb REAL NOT NULL,
-                    memory_total_mb REAL NOT NULL,
-                    disk_percent REAL NOT NULL,
-                    disk_used_gb REAL NOT NULL,
-                    disk_total_gb REAL NOT NULL,
-                    network_sent_mb REAL NOT NULL,
-                    network_recv_mb REAL NOT NULL,
-                    network_sent_rate_mbps REAL NOT NULL,
-                    network_recv_rate_mbps REAL NOT NULL
-                )
-            """)
+            version = cursor.execute("PRAGMA user_version").fetchone()[0]
+            table_exists = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'resource_metrics'"
+            ).fetchone() is not None
             
-            # Create index on timestamp for faster queries
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_timestamp 
-                ON resource_metrics(timestamp)
-            """)
+            if table_exists and version < _SCHEMA_VERSION:
+                self._migrate_legacy_table(cursor, version)
+            else:
+                self._create_schema(cursor)
             
-            conn.commit()
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    
+    def _create_schema(self, cursor: sqlite3.Cursor) -> None:
+        """Create the resource_metrics and archive tables and indexes if missing.
+        
+        Timestamps are stored as INTEGER microseconds since the Unix epoch,
+        which keeps index keys at 8 bytes and makes range comparisons plain
+        integer compares. Metric values are stored as fixed-point INTEGERs
+        scaled by _SCALES. The table is WITHOUT ROWID with timestamp as its
+        primary key, so rows are clustered in time order: range scans and
+        ORDER BY timestamp read consecutive leaf pages, and no separate
+        timestamp index has to be maintained on insert.
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS resource_metrics (
+                timestamp INTEGER NOT NULL PRIMARY KEY,
+                cpu_percent INTEGER NOT NULL,
+                memory_percent INTEGER NOT NULL,
+                memory_used_mb INTEGER NOT NULL,
+                memory_total_mb INTEGER NOT NULL,
+                disk_percent INTEGER NOT NULL,
+                disk_used_gb INTEGER NOT NULL,
+                disk_total_gb INTEGER NOT NULL,
+                network_sent_mb INTEGER NOT NULL,
+                network_recv_mb INTEGER NOT NULL,
+                network_sent_rate_mbps INTEGER NOT NULL,
+                network_recv_rate_mbps INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        
+        # Compressed segments written by archive_metrics(), one per bucket
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS resource_metrics_archive (
+                bucket_start INTEGER PRIMARY KEY,
+                first_timestamp INTEGER NOT NULL,
+                last_timestamp INTEGER NOT NULL,
+                row_count INTEGER NOT NULL,
+                data BLOB NOT NULL
+            )
+        """)
+    
+    def _migrate_legacy_table(self, cursor: sqlite3.Cursor, version: int) -> None:
+        """Rewrite a table from an older schema version into the current one.
+        
+        Handles ISO-8601 TEXT timestamps (version 0), REAL metric columns
+        (versions 0 and 1) and the rowid table with a separate timestamp
+        index (versions 0 to 2). Rows sharing a timestamp are collapsed into
+        the first one. Runs inside the caller's transaction, so a failed
+        migration leaves the original table untouched.
+        
+        Args:
+            cursor: Cursor on the writer connection.
+            version: ``user_version`` the database was written with.
+        """
+        cursor.execute("ALTER TABLE resource_metrics RENAME TO resource_metrics_legacy")
+        cursor.execute("DROP INDEX IF EXISTS idx_timestamp")
+        cursor.execute("DROP INDEX IF EXISTS idx_ts_cover")
+        self._create_schema(cursor)
+        
+        if version >= 2:
+            # Already encoded; only the table layout changes
+            cursor.execute(f"""
+                INSERT OR IGNORE INTO resource_metrics ({_SELECT_COLUMNS})
+                SELECT {_SELECT_COLUMNS} FROM resource_metrics_legacy ORDER BY id
+            """)
+            cursor.execute("DROP TABLE resource_metrics_legacy")
+            return
+        
+        rows = cursor.execute("""
+            SELECT timestamp, cpu_percent, memory_percent,
+                   memory_used_mb, memory_total_mb,
+                   disk_percent, disk_used_gb, disk_total_gb,
+                   network_sent_mb, network_recv_mb,
+                   network_sent_rate_mbps, network_recv_rate_mbps
+            FROM resource_metrics_legacy
+            ORDER BY id
+        """).fetchall()
+        cursor.executemany(_INSERT_SQL, (
+            _encode_metrics(ResourceMetrics(
+                datetime.fromisoformat(row[0]) if isinstance(row[0], str)
+                else _from_epoch_us(row[0]),
+                *row[1:]
+            ))
+            for row in rows
+        ))
+        cursor.execute("DROP TABLE resource_metrics_legacy")
     
     def save_metrics(self, metrics: ResourceMetrics) -> bool:
-        """Save a single metrics record to the database.
+        """Queue a single metrics record for saving to the database.
         
-        Inserts a single ResourceMetrics object into the database. This method
-        is thread-safe and uses a transaction for atomicity.
+        The record is put on a queue that a dedicated writer thread drains with
+        save_metrics_batch() every ``flush_interval`` seconds, or sooner once
+        ``flush_batch_size`` records are waiting. The call never blocks on
+        disk I/O, so WAL checkpoints or lock waits cannot delay the caller, and
+        no commit (or fsync) is paid per sample. Queries flush the queue first,
+        so saved records are always visible to them.
         
         Args:
             metrics: ResourceMetrics object containing the metrics data to save.
         
         Returns:
-            bool: True if the save operation was successful, False otherwise.
+            bool: True once the record has been queued.
         
         Note:
-            For saving multiple metrics, use save_metrics_batch() which is more
-            efficient as it uses a single transaction for all records.
+            Call flush() to force buffered records to disk immediately, e.g.
+            before handing the database file to another process. A
+            timezone-aware timestamp is stored as naive local time.
         
         Example:
             >>> metrics = ResourceMetrics(timestamp=datetime.now(), ...)
             >>> success = storage.save_metrics(metrics)
         """
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO resource_metrics (
-                        timestamp, cpu_percent, memory_percent,
-                        memory_used_mb, memory_total_mb,
-                        disk_percent, disk_used_gb, disk_total_gb,
-                        network_sent_mb, network_recv_mb,
-                        network_sent_rate_mbps, network_recv_rate_mbps
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    metrics.timestamp.isoformat(),
-                    metrics.cpu_percent,
-                    metrics.memory_percent,
-                    metrics.memory_used_mb,
-                    metrics.memory_total_mb,
-                    metrics.disk_percent,
-                    metrics.disk_used_gb,
-                    metrics.disk_total_gb,
-                    metrics.network_sent_mb,
-                    metrics.network_recv_mb,
-                    metrics.network_sent_rate_mbps,
-                    metrics.network_recv_rate_mbps
-                ))
-            return True
-        except Exception as e:
-            print(f"Error saving metrics: {e}")
-            return False
+        # Encode on the caller's thread so the writer only runs executemany
+        self._write_queue.put_nowait(_encode_metrics(metrics))
+        return True
+    
+    def flush(self) -> int:
+        """Write all metrics queued by save_metrics() to the database.
+        
+        Blocks until the writer thread has committed every record queued
+        before the call.
+        
+        Returns:
+            int: Number of records that were waiting to be written. Returns 0
+                if the queue was empty.
+        """
+        if threading.current_thread() is self._writer_thread or not self._writer_thread.is_alive():
+            return self._drain_write_queue()
+        
+        pending = self._write_queue.unfinished_tasks
+        if pending:
+            written = threading.Event()
+            self._write_queue.put(written)
+            while not written.wait(0.5):
+                # The writer exited (close() raced with us); finish here
+                if not self._writer_thread.is_alive():
+                    self._drain_write_queue()
+        return pending
+    
+    def _drain_write_queue(self) -> int:
+        """Write everything currently queued from the calling thread."""
+        items = []
+        while True:
+            try:
+                items.append(self._write_queue.get_nowait())
+            except queue.Empty:
+                break
+        rows = [item for item in items if isinstance(item, tuple)]
+        saved = self._insert_rows(rows) if rows else 0
+        stop = False
+        for item in items:
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                stop = True
+            self._write_queue.task_done()
+        if stop and threading.current_thread() is self._writer_thread:
+            # close() ran while the writer was flushing from inside an
+            # archive pass; hand the marker back so _writer_loop still exits
+            self._write_queue.put(_STOP)
+        return saved
+    
+    def _writer_loop(self) -> None:
+        """Background thread body that drains the write queue in batches.
+        
+        Waits for a record, then keeps collecting until flush_batch_size
+        records are gathered, flush_interval has passed, or a flush()/close()
+        marker arrives, and writes the batch in one transaction.
+        """
+        write_queue = self._write_queue
+        while True:
+            batch: List[tuple] = []
+            marker = None
+            deadline = None
+            while len(batch) < self.flush_batch_size:
+                if deadline is None:
+                    timeout = self.flush_interval
+                else:
+                    timeout = max(0.0, deadline - time.monotonic())
+                try:
+                    item = write_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if not isinstance(item, tuple):
+                    marker = item
+                    break
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            
+            # An idle tick has nothing to write; don't open a transaction
+            if batch:
+                self._insert_rows(batch)
+            for _ in range(len(batch) + (marker is not None)):
+                write_queue.task_done()
+            if marker is _STOP:
+                return
+            if marker is not None:
+                marker.set()
+            
+            if self.archive_after and time.monotonic() >= self._next_archive:
+                self._next_archive = time.monotonic() + _ARCHIVE_CHECK_INTERVAL
+                self.archive_metrics(datetime.now() - self.archive_after)
     
     def save_metrics_batch(self, metrics_list: List[ResourceMetrics]) -> int:
         """Save multiple metrics records in a single transaction.
@@ -192,7 +704,8 @@ class ResourceDataStorage:
         
         Note:
             This method is preferred for bulk operations as it's significantly
-            faster than calling save_metrics() multiple times.
+            faster than calling save_metrics() multiple times. Rows are encoded
+            lazily and inserted in chunks of 5000 within the one transaction.
         
         Example:
             >>> metrics_list = [metrics1, metrics2, metrics3]
@@ -200,41 +713,226 @@ class ResourceDataStorage:
         """
         if not metrics_list:
             return 0
+        return self._insert_rows(chain.from_iterable(
+            _encode_metrics_batch(metrics_list[i:i + 5000])
+            for i in range(0, len(metrics_list), 5000)
+        ))
+    
+    def _insert_rows(self, rows: Iterable[tuple], chunk_size: int = 5000) -> int:
+        """Insert rows already encoded by _encode_metrics() in one transaction."""
+        try:
+            with self._get_connection(write=True) as conn:
+                inserted = self._execute_chunks(conn, rows, chunk_size)
+                self._row_delta += inserted
+                return inserted
+        except Exception as e:
+            logger.error("Error saving metrics batch: %s", e)
+            return 0
+    
+    @staticmethod
+    def _execute_chunks(
+        conn: sqlite3.Connection,
+        rows: Iterable[tuple],
+        chunk_size: int
+    ) -> int:
+        """Run _INSERT_SQL over rows in executemany chunks of chunk_size.
+        
+        Only one chunk is materialized at a time, so large imports and batches
+        are never fully copied into memory. Each chunk is sorted, which orders
+        it by timestamp, the clustered key. INSERT OR IGNORE skips timestamps
+        already in resource_metrics; rows whose timestamp is in an archive
+        segment overlapping the chunk are filtered out beforehand. The caller
+        owns the transaction.
+        
+        Returns:
+            int: Number of rows inserted, not counting duplicate timestamps.
+        """
+        rows = iter(rows)
+        changes = conn.total_changes
+        while True:
+            chunk = sorted(islice(rows, chunk_size))
+            if not chunk:
+                return conn.total_changes - changes
+            archived = _archived_timestamps(conn, chunk[0][0], chunk[-1][0])
+            if archived:
+                chunk = [row for row in chunk if row[0] not in archived]
+            conn.executemany(_INSERT_SQL, chunk)
+    
+    def bulk_import(
+        self,
+        metrics_iter: Iterable[ResourceMetrics],
+        chunk_size: int = 10000
+    ) -> int:
+        """Import a large number of metrics, e.g. when merging another database.
+        
+        Rows are inserted with executemany in chunks of ``chunk_size`` so the
+        iterator is never fully materialized, and each chunk is sorted by
+        timestamp first so it is written into the clustered table in key
+        order. Everything runs in one transaction, so on error the whole
+        import is rolled back. Samples whose timestamp is already stored,
+        live or archived, are skipped.
         
+        Args:
+            metrics_iter: Iterable of ResourceMetrics objects to import.
+            chunk_size: Number of rows passed to each executemany call.
+                Default is 10000.
+        
+        Returns:
+            int: Number of new records imported. Returns 0 on error.
+        
+        Note:
+            Readers do not see any of the imported rows until the import
+            commits. ANALYZE is run afterwards to refresh planner statistics.
+        
+        Example:
+            >>> other = ResourceDataStorage("other_monitor.db")
+            >>> storage.bulk_import(other.iter_metrics_by_time_range())
+        """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                data = [
-                    (
-                        m.timestamp.isoformat(),
-                        m.cpu_percent,
-                        m.memory_percent,
-                        m.memory_used_mb,
-                        m.memory_total_mb,
-                        m.disk_percent,
-                        m.disk_used_gb,
-                        m.disk_total_gb,
-                        m.network_sent_mb,
-                        m.network_recv_mb,
-                        m.network_sent_rate_mbps,
-                        m.network_recv_rate_mbps
-                    )
-                    for m in metrics_list
-                ]
-                cursor.executemany("""
-                    INSERT INTO resource_metrics (
-                        timestamp, cpu_percent, memory_percent,
-                        memory_used_mb, memory_total_mb,
-                        disk_percent, disk_used_gb, disk_total_gb,
-                        network_sent_mb, network_recv_mb,
-                        network_sent_rate_mbps, network_recv_rate_mbps
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, data)
-            return len(metrics_list)
+            self.flush()
+            metrics_iter = iter(metrics_iter)
+            batches = iter(lambda: list(islice(metrics_iter, chunk_size)), [])
+            rows = chain.from_iterable(map(_encode_metrics_batch, batches))
+            with self._get_connection(write=True) as conn:
+                total = self._execute_chunks(conn, rows, chunk_size)
+                self._row_delta += total
+            
+            with self._write_lock:
+                self._writer.execute("ANALYZE")
+            return total
         except Exception as e:
-            print(f"Error saving metrics batch: {e}")
+            logger.error("Error importing metrics: %s", e)
             return 0
     
+    def archive_metrics(
+        self,
+        before_date: datetime,
+        bucket: timedelta = timedelta(hours=1)
+    ) -> int:
+        """Move old metrics into compressed per-bucket archive segments.
+        
+        Rows older than before_date (rounded down to a bucket boundary, so
+        only complete buckets are archived) are packed into one compressed
+        blob per bucket in resource_metrics_archive and removed from
+        resource_metrics. Every query method reads archived rows transparently,
+        so this only changes how history is stored, not what queries return.
+        Each bucket is moved in its own short transaction, so a large backlog
+        never holds the write lock long enough to block the collector.
+        
+        Args:
+            before_date: Archive metrics with timestamps before this date/time.
+            bucket: Time span covered by one archive segment. Default is one
+                hour.
+        
+        Returns:
+            int: Number of records archived, not counting samples whose
+                timestamp was already archived (those are dropped). Returns 0
+                if nothing was old enough; if an error occurs, the number
+                archived before it.
+        
+        Example:
+            >>> # Keep the last day uncompressed
+            >>> storage.archive_metrics(datetime.now() - timedelta(days=1))
+        """
+        bucket_us = bucket // _MICROSECOND
+        cutoff = _to_epoch_us(before_date) // bucket_us * bucket_us
+        row_dtype = np.dtype((np.int64, len(_COLUMNS)))
+        total = 0
+        try:
+            self.flush()
+            while True:
+                with self._get_connection(write=True) as conn:
+                    first = conn.execute(
+                        "SELECT MIN(timestamp) FROM resource_metrics WHERE timestamp < ?",
+                        (cutoff,)
+                    ).fetchone()[0]
+                    if first is None:
+                        break
+                    
+                    key = first // bucket_us * bucket_us
+                    bucket_end = key + bucket_us
+                    segment = np.fromiter(
+                        conn.execute(_SELECT_BUCKET_SQL, (key, bucket_end)), dtype=row_dtype
+                    )
+                    added = len(segment)
+                    existing = conn.execute(
+                        "SELECT row_count, data FROM resource_metrics_archive WHERE bucket_start = ?",
+                        (key,)
+                    ).fetchone()
+                    if existing:
+                        # Rows that arrived late for an already archived bucket.
+                        # np.unique keeps the first occurrence of a timestamp,
+                        # so an already archived sample wins over a re-saved copy
+                        merged = np.concatenate((_unpack_segment(existing[1], existing[0]), segment))
+                        _, first_index = np.unique(merged[:, 0], return_index=True)
+                        segment = merged[first_index]
+                        added = len(segment) - existing[0]
+                        # Dropped duplicates were counted when they were inserted
+                        self._row_delta -= len(merged) - len(segment)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO resource_metrics_archive VALUES (?, ?, ?, ?, ?)",
+                        (key, int(segment[0, 0]), int(segment[-1, 0]),
+                         len(segment), _pack_segment(segment))
+                    )
+                    conn.execute(
+                        "DELETE FROM resource_metrics WHERE timestamp >= ? AND timestamp < ?",
+                        (key, bucket_end)
+                    )
+                total += added
+            return total
+        except Exception as e:
+            logger.error("Error archiving metrics: %s", e)
+            return total
+    
+    def _read_archive(
+        self,
+        conn: sqlite3.Connection,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        limit: Optional[int] = None,
+        newest: bool = False
+    ) -> np.ndarray:
+        """Decode archived rows within a time range as an (n, 12) int64 array.
+        
+        With limit, segments are decoded in time order (newest first if
+        newest) only until limit rows are collected, and the result is the
+        oldest (or newest) limit rows in chronological order.
+        """
+        segments = []
+        collected = 0
+        for segment in self._iter_archive(conn, start_time, end_time, newest):
+            segments.append(segment)
+            collected += len(segment)
+            if limit and collected >= limit:
+                break
+        if not segments:
+            return np.empty((0, len(_COLUMNS)), dtype=np.int64)
+        if newest:
+            segments.reverse()
+        rows = np.concatenate(segments)
+        if limit:
+            rows = rows[-limit:] if newest else rows[:limit]
+        return rows
+    
+    def _iter_archive(
+        self,
+        conn: sqlite3.Connection,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        newest: bool = False
+    ) -> Iterator[np.ndarray]:
+        """Yield archived rows within a time range one decoded segment at a time.
+        
+        Segments come oldest first, or newest first if newest; the rows
+        within each segment are always in chronological order.
+        """
+        start = _to_epoch_us(start_time) if start_time else _MIN_TIMESTAMP
+        end = _to_epoch_us(end_time) if end_time else _MAX_TIMESTAMP
+        query = _ARCHIVE_RANGE_DESC_SQL if newest else _ARCHIVE_RANGE_SQL
+        for count, data in conn.execute(query, (start, end)):
+            values = _unpack_segment(data, count)
+            yield values[(values[:, 0] >= start) & (values[:, 0] <= end)]
+    
     def get_metrics_by_time_range(
         self,
         start_time: Optional[datetime] = None,
@@ -245,6 +943,8 @@ class ResourceDataStorage:
         
         Queries the database for metrics records falling within the specified
         time range. The results are returned in chronological order (oldest first).
+        Timezone-aware bounds are converted to naive local time, the clock
+        timestamps are stored in, and returned timestamps are always naive.
         
         Args:
             start_time: Start of the time range (inclusive). If None, no lower
@@ -267,34 +967,399 @@ class ResourceDataStorage:
             >>> # Get only first 100 records
             >>> recent = storage.get_metrics_by_time_range(start, end, limit=100)
         """
+        return list(self.iter_metrics_by_time_range(start_time, end_time, limit))
+    
+    def iter_metrics_by_time_range(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[ResourceMetrics]:
+        """Iterate over metrics within a time range without building a list.
+        
+        Takes the same arguments as get_metrics_by_time_range() but yields
+        records as the cursor steps through the result, so memory use stays
+        constant however large the range is.
+        
+        Args:
+            start_time: Start of the time range (inclusive). If None, no lower
+                limit is applied.
+            end_time: End of the time range (inclusive). If None, no upper limit
+                is applied.
+            limit: Maximum number of records to yield. If None, all matching
+                records are yielded.
+        
+        Yields:
+            ResourceMetrics: Matching records in chronological order. Iteration
+                stops early if an error occurs.
+        
+        Note:
+            A pooled reader connection is held until the iterator is exhausted
+            or closed, so don't keep partially consumed iterators around.
+        
+        Example:
+            >>> for metrics in storage.iter_metrics_by_time_range(start, end):
+            ...     peak = max(peak, metrics.cpu_percent)
+        """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = "SELECT * FROM resource_metrics WHERE 1=1"
-                params = []
+                query, params = self._build_range_query(
+                    _SELECT_COLUMNS, start_time, end_time, limit
+                )
+                rows = conn.execute(query, params)
                 
-                if start_time:
-                    query += " AND timestamp >= ?"
-                    params.append(start_time.isoformat())
+                # Only pay for the merge when there are archived rows in range
+                segments = self._iter_archive(conn, start_time, end_time)
+                first = next(segments, None)
+                if first is not None:
+                    archived = chain.from_iterable(
+                        segment.tolist() for segment in chain((first,), segments)
+                    )
+                    rows = heapq.merge(archived, rows, key=itemgetter(0))
                 
-                if end_time:
-                    query += " AND timestamp <= ?"
-                    params.append(end_time.isoformat())
+                for row in islice(rows, limit or None):
+                    yield self._row_to_metrics(row)
+        except Exception as e:
+            logger.error("Error retrieving metrics: %s", e)
+    
+    def get_metrics_arrays(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        newest: bool = False
+    ) -> Dict[str, np.ndarray]:
+        """Retrieve metrics within a time range as columnar NumPy arrays.
+        
+        Takes the same arguments as get_metrics_by_time_range() but skips
+        building one ResourceMetrics object per row. This is the preferred
+        path for plotting or aggregating large ranges.
+        
+        Args:
+            start_time: Start of the time range (inclusive). If None, no lower
+                limit is applied.
+            end_time: End of the time range (inclusive). If None, no upper limit
+                is applied.
+            limit: Maximum number of records to return. If None, all matching
+                records are returned.
+            columns: ResourceMetrics field names to fetch. If None, every field
+                is returned. 'timestamp' is always included.
+            newest: If True, limit keeps the most recent records in the range
+                instead of the oldest. The limit is applied in SQL, so rows
+                past it are never read.
+        
+        Returns:
+            Dict[str, np.ndarray]: One array per requested field, keyed by
+                field name and ordered chronologically. 'timestamp' is a
+                datetime64[us] array; every other column is float64. Arrays are
+                empty if no records match or if an error occurs.
+        
+        Raises:
+            ValueError: If columns contains a name that is not a metrics field.
+        
+        Note:
+            Requesting only the charted fields (timestamp, cpu_percent,
+            memory_percent, disk_percent and the two network rates) skips
+            decoding and copying the columns the charts don't use.
+        
+        Example:
+            >>> arrays = storage.get_metrics_arrays(start, end)
+            >>> ax.plot(arrays['timestamp'], arrays['cpu_percent'])
+            >>> # Only the last 1000 records of the range
+            >>> recent = storage.get_metrics_arrays(start, end, 1000, newest=True)
+        """
+        names = _COLUMNS
+        if columns is not None:
+            unknown = [name for name in columns if name not in _SCALE_BY_COLUMN]
+            if unknown:
+                raise ValueError(f"Unknown metrics columns: {unknown}")
+            names = ('timestamp',) + tuple(
+                name for name in columns if name != 'timestamp'
+            )
+        
+        dtype = np.dtype(
+            [('timestamp', 'datetime64[us]')] + [(name, 'f8') for name in names[1:]]
+        )
+        records = self._fetch_records(dtype, start_time, end_time, limit, newest)
+        return {name: np.ascontiguousarray(records[name]) for name in names}
+    
+    def get_metrics_numpy(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> np.ndarray:
+        """Retrieve metrics within a time range as a NumPy record array.
+        
+        Rows are converted to METRICS_DTYPE inside NumPy's array constructor,
+        so no Python object is built per row. Use this for large ranges such
+        as full-history exports; use _row_to_metrics() on individual records
+        only where ResourceMetrics objects are really needed.
+        
+        Args:
+            start_time: Start of the time range (inclusive). If None, no lower
+                limit is applied.
+            end_time: End of the time range (inclusive). If None, no upper limit
+                is applied.
+            limit: Maximum number of records to return. If None, all matching
+                records are returned.
+        
+        Returns:
+            np.ndarray: Structured array of METRICS_DTYPE ordered
+                chronologically: a datetime64[us] 'timestamp' field followed
+                by one float32 field per metric. Empty if no records match or
+                if an error occurs.
+        
+        Example:
+            >>> records = storage.get_metrics_numpy(start, end)
+            >>> peak = records['cpu_percent'].max()
+        """
+        return self._fetch_records(METRICS_DTYPE, start_time, end_time, limit)
+    
+    def _fetch_records(
+        self,
+        dtype: np.dtype,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        limit: Optional[int],
+        newest: bool = False
+    ) -> np.ndarray:
+        """Run a range query for dtype's fields and decode it into a record array.
+        
+        Rows are copied straight from the cursor into the array with
+        np.fromiter, so no intermediate list of row tuples is built. With
+        newest, the query walks the index backwards and the result is
+        flipped back into chronological order. Archived rows are bounded by
+        the same limit, and when the live table alone fills it, only the
+        archive span that could still displace those rows is read.
+        """
+        archived = None
+        try:
+            with self._get_connection() as conn:
+                query, params = self._build_range_query(
+                    ", ".join(dtype.names), start_time, end_time, limit, newest
+                )
+                records = np.fromiter(conn.execute(query, params), dtype=dtype)
+                if newest:
+                    records = records[::-1].copy()
                 
-                query += " ORDER BY timestamp ASC"
+                archive_start, archive_end = start_time, end_time
+                if limit and len(records) == limit:
+                    if newest:
+                        archive_start = records['timestamp'][0].astype(datetime)
+                    else:
+                        archive_end = records['timestamp'][-1].astype(datetime)
+                archived = self._read_archive(conn, archive_start, archive_end, limit, newest)
+        except Exception as e:
+            logger.error("Error retrieving metrics arrays: %s", e)
+            records = np.empty(0, dtype=dtype)
+        
+        if archived is not None and len(archived):
+            older = np.empty(len(archived), dtype=dtype)
+            for name in dtype.names:
+                older[name] = archived[:, _COLUMNS.index(name)]
+            records = np.concatenate((older, records))
+            records = records[np.argsort(records['timestamp'], kind='stable')]
+            if limit:
+                records = records[-limit:] if newest else records[:limit]
+        for name in dtype.names[1:]:
+            records[name] /= _SCALE_BY_COLUMN[name]
+        return records
+    
+    def get_downsampled(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        n_buckets: int = 1000,
+        bucket: Optional[timedelta] = None
+    ) -> Dict[str, np.ndarray]:
+        """Retrieve the charted metrics aggregated into equal time buckets.
+        
+        The range is split into n_buckets intervals, or into intervals of a
+        fixed ``bucket`` width, and SQLite computes the per-bucket count, sum
+        and maximum with a GROUP BY over the clustered timestamp key, so only
+        one row per bucket crosses into Python however many samples are
+        stored. Archived segments are reduced to per-bucket rows with NumPy
+        one at a time as they are decoded, so memory stays bounded by the
+        bucket count there too.
+        
+        Args:
+            start_time: Start of the time range (inclusive). If None, the
+                oldest stored timestamp is used.
+            end_time: End of the time range (inclusive). If None, the newest
+                stored timestamp is used.
+            n_buckets: Maximum number of buckets to return. Default is 1000.
+                Ignored when ``bucket`` is given.
+            bucket: Fixed bucket width, e.g. ``timedelta(minutes=1)``. Buckets
+                are then aligned to multiples of the width since the epoch,
+                so repeated calls over a moving window keep the same
+                boundaries. If None (default), the width is derived from
+                n_buckets.
+        
+        Returns:
+            Dict[str, np.ndarray]: 'timestamp' holds the start of each
+                non-empty bucket as datetime64[us]. For every charted metric
+                (cpu_percent, memory_percent, disk_percent and the two network
+                rates) there is a float64 array with the bucket average under
+                the field name and the bucket maximum under '<name>_max'.
+                Arrays are empty if no records match or if an error occurs.
+        
+        Example:
+            >>> buckets = storage.get_downsampled(start, end, n_buckets=800)
+            >>> ax.plot(buckets['timestamp'], buckets['cpu_percent'])
+            >>> ax.plot(buckets['timestamp'], buckets['cpu_percent_max'])
+            >>> # One bucket per minute over the last day
+            >>> daily = storage.get_downsampled(start, end, bucket=timedelta(minutes=1))
+        """
+        names = _CHARTED_COLUMNS[1:]
+        table = np.empty((0, 2 + 2 * len(names)))
+        origin = start = end = 0
+        bucket_us = 1
+        try:
+            if start_time is None:
+                start_time = self.get_oldest_timestamp()
+            if end_time is None:
+                end_time = self.get_newest_timestamp()
+            if start_time is not None and end_time is not None:
+                start = _to_epoch_us(start_time)
+                end = _to_epoch_us(end_time)
+                if bucket is not None:
+                    bucket_us = max(1, bucket // timedelta(microseconds=1))
+                    origin = start - start % bucket_us
+                else:
+                    bucket_us = max(1, -(-(end - start + 1) // max(1, n_buckets)))
+                    origin = start
                 
-                if limit:
-                    query += " LIMIT ?"
-                    params.append(limit)
+                value_columns = [_COLUMNS.index(name) for name in names]
+                with self._get_connection() as conn:
+                    rows = conn.execute(
+                        _DOWNSAMPLE_SQL, (origin, bucket_us, start, end)
+                    ).fetchall()
+                    parts = [np.array(rows, dtype=np.float64).reshape(len(rows), table.shape[1])]
+                    for segment in self._iter_archive(conn, start_time, end_time):
+                        if not len(segment):
+                            continue
+                        # Segment rows are in time order, so each bucket is a
+                        # contiguous run that reduceat folds into one row
+                        keys = (segment[:, 0] - origin) // bucket_us
+                        starts = np.flatnonzero(np.diff(keys, prepend=keys[0] - 1))
+                        values = segment[:, value_columns]
+                        part = np.empty((len(starts), table.shape[1]))
+                        part[:, 0] = keys[starts]
+                        part[:, 1] = np.diff(starts, append=len(segment))
+                        part[:, 2::2] = np.add.reduceat(values, starts)
+                        part[:, 3::2] = np.maximum.reduceat(values, starts)
+                        parts.append(part)
                 
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
-                
-                return [self._row_to_metrics(row) for row in rows]
+                table = np.concatenate(parts)
         except Exception as e:
-            print(f"Error retrieving metrics: {e}")
-            return []
+            logger.error("Error retrieving downsampled metrics: %s", e)
+        
+        keys, inverse = np.unique(table[:, 0], return_inverse=True)
+        counts = np.bincount(inverse, weights=table[:, 1], minlength=len(keys))
+        result = {
+            'timestamp': (origin + keys.astype(np.int64) * bucket_us).view('datetime64[us]')
+        }
+        for index, name in enumerate(names):
+            scale = _SCALE_BY_COLUMN[name]
+            sums = np.bincount(inverse, weights=table[:, 2 + 2 * index], minlength=len(keys))
+            maxima = np.full(len(keys), -np.inf)
+            np.maximum.at(maxima, inverse, table[:, 3 + 2 * index])
+            result[name] = sums / counts / scale
+            result[f"{name}_max"] = maxima / scale
+        return result
+    
+    def get_aggregates_by_time_range(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> dict:
+        """Compute average, minimum and maximum of the charted metrics in a range.
+        
+        SQLite computes the count, sums and extremes in a single scan of the
+        clustered timestamp key, so only one row crosses into Python however
+        many samples the range holds. Archived segments are reduced with
+        NumPy one at a time.
+        
+        Args:
+            start_time: Start of the time range (inclusive). If None, no lower
+                limit is applied.
+            end_time: End of the time range (inclusive). If None, no upper limit
+                is applied.
+        
+        Returns:
+            dict: 'count' (int) is the number of records in the range. For
+                every charted metric (cpu_percent, memory_percent,
+                disk_percent and the two network rates) there are
+                '<name>_avg', '<name>_min' and '<name>_max' floats, which are
+                None when the range is empty. Returns an empty dictionary if
+                an error occurs.
+        
+        Example:
+            >>> aggregates = storage.get_aggregates_by_time_range(start, end)
+            >>> print(f"Peak CPU: {aggregates['cpu_percent_max']}")
+        """
+        names = _CHARTED_COLUMNS[1:]
+        indices = [_COLUMNS.index(name) for name in names]
+        start = _to_epoch_us(start_time) if start_time else _MIN_TIMESTAMP
+        end = _to_epoch_us(end_time) if end_time else _MAX_TIMESTAMP
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(_AGGREGATE_SQL, (start, end)).fetchone()
+                count = row[0]
+                # (sum, min, max) per metric; None while nothing is counted
+                totals = [list(row[1 + 3 * i:4 + 3 * i]) for i in range(len(names))]
+                for segment in self._iter_archive(conn, start_time, end_time):
+                    if not len(segment):
+                        continue
+                    values = segment[:, indices]
+                    count += len(values)
+                    for total, value_sum, low, high in zip(
+                        totals, values.sum(axis=0).tolist(),
+                        values.min(axis=0).tolist(), values.max(axis=0).tolist()
+                    ):
+                        if total[0] is None:
+                            total[:] = [value_sum, low, high]
+                        else:
+                            total[:] = [total[0] + value_sum, min(total[1], low), max(total[2], high)]
+        except Exception as e:
+            logger.error("Error computing aggregates: %s", e)
+            return {}
+        
+        aggregates = {'count': count}
+        for name, (value_sum, low, high) in zip(names, totals):
+            scale = _SCALE_BY_COLUMN[name]
+            if count:
+                aggregates[f"{name}_avg"] = value_sum / count / scale
+                aggregates[f"{name}_min"] = low / scale
+                aggregates[f"{name}_max"] = high / scale
+            else:
+                aggregates[f"{name}_avg"] = aggregates[f"{name}_min"] = aggregates[f"{name}_max"] = None
+        return aggregates
+    
+    def _build_range_query(
+        self,
+        columns: str,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        limit: Optional[int],
+        descending: bool = False
+    ) -> Tuple[str, list]:
+        """Build the SELECT statement and parameters for a time-range query.
+        
+        The SQL text depends only on the column list and order; missing bounds are
+        passed as _MIN_TIMESTAMP/_MAX_TIMESTAMP and a missing limit as -1
+        (no limit in SQLite), so sqlite3's statement cache reuses one compiled
+        statement for every combination of arguments.
+        """
+        query = _range_sql(columns, descending)
+        params = [
+            _to_epoch_us(start_time) if start_time else _MIN_TIMESTAMP,
+            _to_epoch_us(end_time) if end_time else _MAX_TIMESTAMP,
+            limit if limit else -1
+        ]
+        return query, params
     
     def get_latest_metrics(self, count: int = 1) -> List[ResourceMetrics]:
         """Get the most recent metrics records from the database.
@@ -311,6 +1376,12 @@ class ResourceDataStorage:
                 (oldest of the selected records first). Returns empty list if no
                 records exist or if an error occurs.
         
+        Note:
+            The result is cached until the next write, so polling this faster
+            than metrics are saved (e.g. on every UI refresh) only costs a
+            data_version check. The cached ResourceMetrics objects are shared
+            between calls and should not be modified.
+        
         Example:
             >>> # Get the single most recent metric
             >>> latest = storage.get_latest_metrics(1)
@@ -318,19 +1389,36 @@ class ResourceDataStorage:
             >>> recent = storage.get_latest_metrics(10)
         """
         try:
+            if self._write_queue.unfinished_tasks:
+                self.flush()
+            self._check_external_writes()
+            
+            with self._count_lock:
+                generation = self._count_generation
+                cached = self._latest_cache
+            if cached is not None and cached[:2] == (generation, count):
+                return list(cached[2])
+            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM resource_metrics
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                """, (count,))
+                cursor.execute(_SELECT_LATEST_SQL, (count,))
                 rows = cursor.fetchall()
+                rows.reverse()
                 
-                # Reverse to get chronological order
-                return [self._row_to_metrics(row) for row in reversed(rows)]
+                # Fall back to the newest archived rows if the table is short;
+                # only the newest segments holding count rows are decoded
+                if len(rows) < count:
+                    rows = self._read_archive(conn, None, None, count, newest=True).tolist() + rows
+                    rows.sort(key=lambda row: row[0])
+                    rows = rows[-count:]
+            
+            result = [self._row_to_metrics(row) for row in rows]
+            with self._count_lock:
+                if generation == self._count_generation:
+                    self._latest_cache = (generation, count, result)
+            return list(result)
         except Exception as e:
-            print(f"Error retrieving latest metrics: {e}")
+            logger.error("Error retrieving latest metrics: %s", e)
             return []
     
     def get_all_metrics(self) -> List[ResourceMetrics]:
@@ -338,16 +1426,73 @@ class ResourceDataStorage:
         return self.get_metrics_by_time_range()
     
     def get_metrics_count(self) -> int:
-        """Get the total number of stored metrics."""
+        """Get the total number of stored metrics, including archived ones.
+        
+        SQLite keeps no row count, so COUNT(*) scans the whole table. The
+        result is therefore counted once and then kept up to date by this
+        object's own inserts and deletes, making repeated calls O(1). It is
+        recounted whenever another connection has committed to the database
+        or a write was rolled back.
+        """
         try:
+            if self._write_queue.unfinished_tasks:
+                self.flush()
+            self._check_external_writes()
+            
+            with self._count_lock:
+                if self._row_count is not None:
+                    return self._row_count
+                generation = self._count_generation
+            
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM resource_metrics")
-                return cursor.fetchone()[0]
+                cursor.execute("""
+                    SELECT (SELECT COUNT(*) FROM resource_metrics)
+                         + (SELECT IFNULL(SUM(row_count), 0) FROM resource_metrics_archive)
+                """)
+                count = cursor.fetchone()[0]
+            
+            # Only cache the count if no write changed it in the meantime
+            with self._count_lock:
+                if generation == self._count_generation:
+                    self._row_count = count
+            return count
         except Exception as e:
-            print(f"Error counting metrics: {e}")
+            logger.error("Error counting metrics: %s", e)
             return 0
     
+    def _check_external_writes(self) -> None:
+        """Drop cached query results if another connection has committed.
+        
+        data_version only changes for commits made by other connections, so
+        our own writes (tracked through _adjust_row_count) don't trigger it.
+        The check is skipped rather than wait while our writer is busy.
+        """
+        if self._write_lock.acquire(blocking=False):
+            try:
+                version = self._writer.execute("PRAGMA data_version").fetchone()[0]
+            finally:
+                self._write_lock.release()
+            if version != self._data_version:
+                self._data_version = version
+                self._adjust_row_count(None)
+    
+    def _adjust_row_count(self, delta: Optional[int]) -> None:
+        """Apply delta to the cached row count, or drop the cache if None.
+        
+        Unless delta is 0 (a commit that inserted and deleted nothing), the
+        write generation advances, which also invalidates the
+        get_latest_metrics() cache.
+        """
+        if delta == 0:
+            return
+        with self._count_lock:
+            self._count_generation += 1
+            if delta is None or self._row_count is None:
+                self._row_count = None
+            else:
+                self._row_count += delta
+    
     def get_oldest_timestamp(self) -> Optional[datetime]:
         """Get the timestamp of the oldest stored metric.
         
@@ -363,13 +1508,13 @@ class ResourceDataStorage:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT MIN(timestamp) FROM resource_metrics")
+                cursor.execute(_OLDEST_SQL)
                 result = cursor.fetchone()[0]
-                if result:
-                    return datetime.fromisoformat(result)
+                if result is not None:
+                    return _from_epoch_us(result)
                 return None
         except Exception as e:
-            print(f"Error getting oldest timestamp: {e}")
+            logger.error("Error getting oldest timestamp: %s", e)
             return None
     
     def get_newest_timestamp(self) -> Optional[datetime]:
@@ -387,21 +1532,23 @@ class ResourceDataStorage:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT MAX(timestamp) FROM resource_metrics")
+                cursor.execute(_NEWEST_SQL)
                 result = cursor.fetchone()[0]
-                if result:
-                    return datetime.fromisoformat(result)
+                if result is not None:
+                    return _from_epoch_us(result)
                 return None
         except Exception as e:
-            print(f"Error getting newest timestamp: {e}")
+            logger.error("Error getting newest timestamp: %s", e)
             return None
     
     def delete_old_metrics(self, before_date: datetime) -> int:
         """Delete metrics older than the specified date.
         
         Removes all metric records with timestamps before the specified date.
-        This is useful for managing database size by removing old data. After
-        deletion, the database is vacuumed to reclaim disk space.
+        This is useful for managing database size by removing old data. Freed
+        pages stay in the database and are reused by subsequent inserts; call
+        compact() to shrink the file, optionally a bounded number of pages at
+        a time.
         
         Args:
             before_date: Delete all metrics with timestamps strictly before
@@ -422,26 +1569,45 @@ class ResourceDataStorage:
             >>> print(f"Deleted {deleted} old records")
         """
         try:
-            with self._get_connection() as conn:
+            self.flush()
+            cutoff = _to_epoch_us(before_date)
+            with self._get_connection(write=True) as conn:
                 cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM resource_metrics WHERE timestamp < ?",
-                    (before_date.isoformat(),)
-                )
+                cursor.execute("DELETE FROM resource_metrics WHERE timestamp < ?", (cutoff,))
                 deleted_count = cursor.rowcount
-                # Vacuum database to reclaim space
-                cursor.execute("VACUUM")
+                
+                # Whole archive segments before the cutoff go at once; a
+                # segment straddling it is rewritten without the old rows
+                deleted_count += cursor.execute(
+                    "SELECT IFNULL(SUM(row_count), 0) FROM resource_metrics_archive WHERE last_timestamp < ?",
+                    (cutoff,)
+                ).fetchone()[0]
+                cursor.execute("DELETE FROM resource_metrics_archive WHERE last_timestamp < ?", (cutoff,))
+                straddling = cursor.execute(
+                    "SELECT bucket_start, row_count, data FROM resource_metrics_archive WHERE first_timestamp < ?",
+                    (cutoff,)
+                ).fetchall()
+                for key, count, data in straddling:
+                    segment = _unpack_segment(data, count)
+                    segment = segment[segment[:, 0] >= cutoff]
+                    deleted_count += count - len(segment)
+                    cursor.execute(
+                        "UPDATE resource_metrics_archive SET first_timestamp = ?, row_count = ?, data = ? WHERE bucket_start = ?",
+                        (int(segment[0, 0]), len(segment), _pack_segment(segment), key)
+                    )
+                self._row_delta -= deleted_count
                 return deleted_count
         except Exception as e:
-            print(f"Error deleting old metrics: {e}")
+            logger.error("Error deleting old metrics: %s", e)
             return 0
     
     def delete_all_metrics(self) -> int:
         """Delete all stored metrics from the database.
         
-        Removes all metric records from the database and vacuums the database
-        to reclaim disk space. This effectively resets the database to an
-        empty state while preserving the schema.
+        Removes all metric records from the database and releases the freed
+        pages back to the file system when incremental auto-vacuum is enabled.
+        This effectively resets the database to an empty state while
+        preserving the schema.
         
         Returns:
             int: Number of records deleted. Returns 0 if database was already
@@ -457,31 +1623,104 @@ class ResourceDataStorage:
             >>> print(f"Deleted {deleted} records")
         """
         try:
-            with self._get_connection() as conn:
+            self.flush()
+            with self._get_connection(write=True) as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM resource_metrics")
                 deleted_count = cursor.rowcount
-                cursor.execute("VACUUM")
-                return deleted_count
+                deleted_count += cursor.execute(
+                    "SELECT IFNULL(SUM(row_count), 0) FROM resource_metrics_archive"
+                ).fetchone()[0]
+                cursor.execute("DELETE FROM resource_metrics_archive")
+                self._row_delta -= deleted_count
+            
+            # incremental_vacuum only runs to completion via executescript,
+            # which needs to be outside the write transaction
+            with self._write_lock:
+                self._writer.executescript("PRAGMA incremental_vacuum")
+            return deleted_count
         except Exception as e:
-            print(f"Error deleting all metrics: {e}")
+            logger.error("Error deleting all metrics: %s", e)
             return 0
     
-    def _row_to_metrics(self, row: sqlite3.Row) -> ResourceMetrics:
-        """Convert a database row to a ResourceMetrics object."""
+    def compact(self, pages: Optional[int] = None) -> bool:
+        """Reclaim free space in the database file.
+        
+        With ``pages`` given, releases at most that many free pages through
+        ``PRAGMA incremental_vacuum``; the work is bounded and nothing else is
+        rewritten, so it is safe to call periodically while collecting.
+        
+        Without ``pages``, runs a full VACUUM, which also converts databases
+        created by older versions to 8 KiB pages and incremental auto-vacuum,
+        and leaves the WAL file empty. VACUUM rewrites the entire file and
+        blocks writers while it runs, so call it during idle time rather than
+        from the collection path.
+        
+        Args:
+            pages: Maximum number of free pages to release. If None (default),
+                the whole file is rebuilt with VACUUM.
+        
+        Returns:
+            bool: True if the database was compacted successfully, False
+                otherwise.
+        
+        Example:
+            >>> storage.delete_old_metrics(cutoff)
+            >>> storage.compact(pages=1000)
+        """
+        try:
+            self.flush()
+            if pages is not None:
+                # Like delete_all_metrics(), this has to go through
+                # executescript for the pragma to free more than one page
+                with self._write_lock:
+                    self._writer.executescript(f"PRAGMA incremental_vacuum({int(pages)})")
+                return True
+            
+            with self._write_lock:
+                writer = self._writer
+                writer.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                page_size = writer.execute("PRAGMA page_size").fetchone()[0]
+                if page_size != _PAGE_SIZE:
+                    # The page size of a WAL database is fixed, so leave WAL
+                    # for the rebuild; that needs every other connection closed
+                    readers = [self._readers.get() for _ in range(self._read_pool_size)]
+                    try:
+                        for reader in readers:
+                            reader.close()
+                        writer.execute("PRAGMA journal_mode=DELETE")
+                        writer.execute(f"PRAGMA page_size={_PAGE_SIZE}")
+                        writer.execute("VACUUM")
+                        writer.execute("PRAGMA journal_mode=WAL")
+                    finally:
+                        for _ in readers:
+                            self._readers.put(self._connect(read_only=True))
+                else:
+                    writer.execute("VACUUM")
+                    writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return True
+        except Exception as e:
+            logger.error("Error compacting database: %s", e)
+            return False
+    
+    def _row_to_metrics(self, row: tuple) -> ResourceMetrics:
+        """Convert a database row selected as _SELECT_COLUMNS to ResourceMetrics."""
+        (timestamp, cpu_percent, memory_percent, memory_used_mb, memory_total_mb,
+         disk_percent, disk_used_gb, disk_total_gb, network_sent_mb,
+         network_recv_mb, network_sent_rate_mbps, network_recv_rate_mbps) = row
         return ResourceMetrics(
-            timestamp=datetime.fromisoformat(row['timestamp']),
-            cpu_percent=row['cpu_percent'],
-            memory_percent=row['memory_percent'],
-            memory_used_mb=row['memory_used_mb'],
-            memory_total_mb=row['memory_total_mb'],
-            disk_percent=row['disk_percent'],
-            disk_used_gb=row['disk_used_gb'],
-            disk_total_gb=row['disk_total_gb'],
-            network_sent_mb=row['network_sent_mb'],
-            network_recv_mb=row['network_recv_mb'],
-            network_sent_rate_mbps=row['network_sent_rate_mbps'],
-            network_recv_rate_mbps=row['network_recv_rate_mbps']
+            timestamp=_from_epoch_us(timestamp),
+            cpu_percent=cpu_percent / 100,
+            memory_percent=memory_percent / 100,
+            memory_used_mb=memory_used_mb / 100,
+            memory_total_mb=memory_total_mb / 100,
+            disk_percent=disk_percent / 100,
+            disk_used_gb=disk_used_gb / 1000,
+            disk_total_gb=disk_total_gb / 1000,
+            network_sent_mb=network_sent_mb / 1000,
+            network_recv_mb=network_recv_mb / 1000,
+            network_sent_rate_mbps=network_sent_rate_mbps / 1000,
+            network_recv_rate_mbps=network_recv_rate_mbps / 1000
         )
     
     def get_statistics(self) -> dict:
@@ -508,33 +1747,26 @@ class ResourceDataStorage:
             ...     print(f"Oldest: {stats['oldest_timestamp']}")
         """
         try:
+            stats = {}
+            
+            # Total count, including archived rows (cached between writes)
+            stats['total_records'] = self.get_metrics_count()
+            
+            # Time range and database size (approximate) in one round trip
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                stats = {}
-                
-                # Total count
-                cursor.execute("SELECT COUNT(*) FROM resource_metrics")
-                stats['total_records'] = cursor.fetchone()[0]
-                
-                # Time range
-                cursor.execute("SELECT MIN(timestamp), MAX(timestamp) FROM resource_metrics")
-                result = cursor.fetchone()
-                if result[0] and result[1]:
-                    stats['oldest_timestamp'] = datetime.fromisoformat(result[0])
-                    stats['newest_timestamp'] = datetime.fromisoformat(result[1])
-                else:
-                    stats['oldest_timestamp'] = None
-                    stats['newest_timestamp'] = None
-                
-                # Database size (approximate)
-                cursor.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
-                result = cursor.fetchone()
-                stats['database_size_mb'] = result[0] / (1024 * 1024) if result else 0
-                
-                return stats
+                oldest, newest, size = conn.execute(_STATISTICS_SQL).fetchone()
+            
+            if oldest is not None and newest is not None:
+                stats['oldest_timestamp'] = _from_epoch_us(oldest)
+                stats['newest_timestamp'] = _from_epoch_us(newest)
+            else:
+                stats['oldest_timestamp'] = None
+                stats['newest_timestamp'] = None
+            stats['database_size_mb'] = size / (1024 * 1024) if size else 0
+            
+            return stats
         except Exception as e:
-            print(f"Error getting statistics: {e}")
+            logger.error("Error getting statistics: %s", e)
             return {}
 
 
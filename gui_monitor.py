@@ -30,18 +30,224 @@ import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox, filedialog
 from matplotlib.figure import Figure
+from matplotlib.axes import Axes
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_pdf import PdfPages
-from matplotlib.animation import FuncAnimation
-import matplotlib.pyplot as plt
-from matplotlib.dates import DateFormatter
+from matplotlib.dates import DateFormatter, date2num, num2date
 from datetime import datetime, timedelta
 from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import io
 import os
+import pickle
+import queue
+import shutil
+import subprocess
+import tempfile
+import time
+import numpy as np
 from resource_collector import ResourceCollector, ResourceMetrics
 from data_storage import ResourceDataStorage
 
 
+# JPEG export settings. Exports are encoded on the export worker, so the
+# extra optimize/progressive passes (about a fifth smaller files) don't block
+# the GUI. 4:2:0 chroma subsampling is the usual choice; '4:4:4' keeps thin
+# colored lines crisper at about 10% more size
+_JPEG_PIL_KWARGS = {'quality': 85, 'optimize': True, 'progressive': True, 'subsampling': '4:2:0'}
+
+# JPEG export resolutions offered in the export panels (dpi)
+_EXPORT_RESOLUTIONS = {"Fast": 100, "Normal": 150, "Print": 300}
+
+# Historical x-axis date formatters for spans up to an hour, up to a day,
+# longer. DateFormatter keeps no per-axis state, so the four historical axes
+# share these instances
+_HIST_DATE_FORMATTERS = (DateFormatter('%H:%M:%S'),
+                         DateFormatter('%m-%d %H:%M'),
+                         DateFormatter('%Y-%m-%d\n%H:%M'))
+
+# Tk label fonts and matplotlib axes title style
+_FONT_TITLE = ("Arial", 18, "bold")
+_FONT_HEADING = ("Arial", 14, "bold")
+_FONT_BODY = ("Arial", 11)
+_FONT_STATS = ("Arial", 10)
+_FONT_SMALL = ("Arial", 9)
+_AXES_TITLE_STYLE = {'fontsize': 12, 'fontweight': 'bold'}
+
+# Ghostscript executable used to recompress PDF exports, if installed
+_GHOSTSCRIPT = shutil.which('gs') or shutil.which('gswin64c') or shutil.which('gswin32c')
+
+# Statistics texts, filled from get_aggregates_by_time_range() results in a
+# single format call
+_HIST_STATS_TEMPLATE = (
+    "Records: {count}\n\n"
+    "CPU - Avg: {cpu_percent_avg:.2f}%, Min: {cpu_percent_min:.2f}%, Max: {cpu_percent_max:.2f}%\n"
+    "Memory - Avg: {memory_percent_avg:.2f}%, Min: {memory_percent_min:.2f}%, Max: {memory_percent_max:.2f}%\n"
+    "Disk - Avg: {disk_percent_avg:.2f}%, Min: {disk_percent_min:.2f}%, Max: {disk_percent_max:.2f}%\n"
+    "Network Sent - Avg: {network_sent_rate_mbps_avg:.2f} Mbps, Max: {network_sent_rate_mbps_max:.2f} Mbps\n"
+    "Network Received - Avg: {network_recv_rate_mbps_avg:.2f} Mbps, Max: {network_recv_rate_mbps_max:.2f} Mbps"
+)
+_HIST_PDF_STATS_TEMPLATE = (
+    "Resource Monitor - Historical Data Statistics\n"
+    f"{'=' * 60}\n\n"
+    "Time Range: {time_range}\n"
+    "Total Records: {count}\n"
+    "Export Date: {export_date}\n\n"
+    f"{'=' * 60}\n\n"
+    "CPU Statistics:\n"
+    "  Average: {cpu_percent_avg:.2f}%\n"
+    "  Minimum: {cpu_percent_min:.2f}%\n"
+    "  Maximum: {cpu_percent_max:.2f}%\n\n"
+    "Memory Statistics:\n"
+    "  Average: {memory_percent_avg:.2f}%\n"
+    "  Minimum: {memory_percent_min:.2f}%\n"
+    "  Maximum: {memory_percent_max:.2f}%\n\n"
+    "Disk Statistics:\n"
+    "  Average: {disk_percent_avg:.2f}%\n"
+    "  Minimum: {disk_percent_min:.2f}%\n"
+    "  Maximum: {disk_percent_max:.2f}%\n\n"
+    "Network Statistics:\n"
+    "  Sent - Average: {network_sent_rate_mbps_avg:.2f} Mbps, Max: {network_sent_rate_mbps_max:.2f} Mbps\n"
+    "  Received - Average: {network_recv_rate_mbps_avg:.2f} Mbps, Max: {network_recv_rate_mbps_max:.2f} Mbps\n"
+)
+
+# Historical series charted and summarised in the statistics panel, in
+# column order
+_HISTORICAL_FIELDS = ('cpu_percent', 'memory_percent', 'disk_percent',
+                      'network_sent_rate_mbps', 'network_recv_rate_mbps')
+
+
+def _parse_datetime_input(date_str: str, time_str: str) -> datetime:
+    """Parse the historical range date and time entries into a datetime.
+    
+    Uses the C fast path of datetime.fromisoformat and only falls back to
+    strptime, which also produces the error message, when that fails.
+    
+    Args:
+        date_str: Date as YYYY-MM-DD.
+        time_str: Time as HH:MM:SS.
+    
+    Returns:
+        datetime: The parsed local time.
+    
+    Raises:
+        ValueError: If the input is not in the expected format.
+    """
+    try:
+        return datetime.fromisoformat(f"{date_str}T{time_str}")
+    except ValueError:
+        return datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M:%S")
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Pick the points of a series to plot with Largest-Triangle-Three-Buckets.
+    
+    The first and last points are always kept and the rest are split into
+    n_out - 2 buckets. From each bucket the point forming the largest
+    triangle with its neighbouring buckets is kept, which preserves peaks and
+    dips that plain decimation drops. The neighbour on the left is the
+    previous bucket's average rather than the point picked there, so all
+    buckets are evaluated at once in NumPy.
+    
+    Args:
+        x: Increasing x values.
+        y: Values of the series, same length as x.
+        n_out: Number of points to keep.
+    
+    Returns:
+        np.ndarray: Sorted indices of the points to keep. All indices if the
+            series has no more than n_out points.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    # Bucket i covers [starts[i], ends[i]) of the interior points 1..n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    counts = ends - starts
+    avg_x = np.add.reduceat(x[:n - 1], starts) / counts
+    avg_y = np.add.reduceat(y[:n - 1], starts) / counts
+    prev_x = np.concatenate(([x[0]], avg_x[:-1]))
+    prev_y = np.concatenate(([y[0]], avg_y[:-1]))
+    next_x = np.concatenate((avg_x[1:], [x[-1]]))
+    next_y = np.concatenate((avg_y[1:], [y[-1]]))
+    
+    # Buckets differ in size by at most one, so pad them to a rectangle
+    index = starts[:, None] + np.arange(counts.max())
+    padding = index >= ends[:, None]
+    index[padding] = starts[np.nonzero(padding)[0]]
+    area = np.abs(
+        (prev_x - next_x)[:, None] * (y[index] - prev_y[:, None])
+        - (prev_x[:, None] - x[index]) * (next_y - prev_y)[:, None]
+    )
+    picked = index[np.arange(len(starts)), area.argmax(axis=1)]
+    return np.concatenate(([0], picked, [n - 1]))
+
+
+def _detached_copy(figure: Figure) -> Figure:
+    """Return an independent copy of a figure for exporting off the GUI thread.
+    
+    The copy has no Tk canvas or callbacks, and its blitted (animated) lines
+    are made static so that savefig includes them.
+    
+    Args:
+        figure: Figure to copy.
+    """
+    copy = pickle.loads(pickle.dumps(figure))
+    FigureCanvasAgg(copy)  # off-screen canvas for layout queries (_axes_bbox)
+    for ax in copy.axes:
+        for line in ax.get_lines():
+            line.set_animated(False)
+    return copy
+
+
+def _compress_pdf(data: bytes) -> bytes:
+    """Re-encode a PDF document with Ghostscript's /ebook settings.
+    
+    Args:
+        data: The PDF document.
+    
+    Returns:
+        bytes: The re-encoded document, or data if that is not smaller.
+    
+    Raises:
+        OSError: If Ghostscript cannot be run.
+        subprocess.SubprocessError: If Ghostscript fails or times out.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'in.pdf')
+        target = os.path.join(tmp, 'out.pdf')
+        with open(source, 'wb') as f:
+            f.write(data)
+        subprocess.run(
+            [_GHOSTSCRIPT, '-sDEVICE=pdfwrite', '-dPDFSETTINGS=/ebook', '-dCompatibilityLevel=1.4',
+             '-dNOPAUSE', '-dBATCH', '-dQUIET', f'-sOutputFile={target}', source],
+            check=True, capture_output=True, timeout=60
+        )
+        with open(target, 'rb') as f:
+            compressed = f.read()
+    return compressed if len(compressed) < len(data) else data
+
+
+def _axes_bbox(ax: Axes):
+    """Return the savefig bbox_inches that crops a figure to one of its axes.
+    
+    Args:
+        ax: Axes to keep, including its title, labels and tick labels.
+    
+    Returns:
+        'tight' if the axes is alone in its figure, otherwise the axes' tight
+        bounding box in inches.
+    """
+    figure = ax.figure
+    if len(figure.axes) == 1:
+        return 'tight'
+    bbox = ax.get_tightbbox(figure.canvas.get_renderer())
+    return bbox.transformed(figure.dpi_scale_trans.inverted()).padded(0.1)
+
+
 class ResourceMonitorGUI:
     """GUI application for real-time resource monitoring with live graphs.
     
@@ -59,7 +265,7 @@ class ResourceMonitorGUI:
         collector (ResourceCollector): Resource collector instance providing metrics.
         db_storage (ResourceDataStorage): Database storage for historical data.
         max_data_points (int): Maximum number of data points in real-time graphs (60).
-        max_historical_in_memory (int): Maximum historical metrics kept in memory (10000).
+        max_historical_in_memory (int): Maximum historical samples kept in memory (10000).
     
     Example:
         >>> collector = ResourceCollector(enable_database_storage=True)
@@ -88,37 +294,77 @@ class ResourceMonitorGUI:
                 (1 second). Lower values provide more responsive updates but may
                 impact performance.
             db_path: Path to SQLite database file for historical data storage.
-                Default is "resource_monitor.db".
+                Default is "resource_monitor.db". Ignored when the collector
+                already saves to a database; its storage is shared instead.
         """
         self.root = root
         self.collector = collector
         self.update_interval = update_interval
         
-        # Database storage for historical data
-        self.db_storage = ResourceDataStorage(db_path)
+        # Database storage for historical data; samples older than an hour
+        # are moved into compressed archive segments in the background. The
+        # collector's storage is reused when it has one: a second connection
+        # to the same file would see each collector commit as an external
+        # write and recount the table on every update tick
+        if collector.db_storage is not None:
+            self.db_storage = collector.db_storage
+            self.db_storage.archive_after = timedelta(hours=1)
+        else:
+            self.db_storage = ResourceDataStorage(db_path, archive_after=timedelta(hours=1))
         
         # Configure window
         self.root.title("GUI Resource Monitor")
         self.root.geometry("1400x900")
         self.root.configure(bg='#f0f0f0')
         
-        # Data storage for graphs (keep last 60 data points)
+        # Data storage for graphs (keep last 60 data points). One preallocated
+        # ring buffer, one row per series (cpu, memory, disk, network sent,
+        # network recv), written in place at the head index. Each sample's
+        # time label is formatted once and kept in the matching slot
         self.max_data_points = 60
-        self.time_data: List[datetime] = []
-        self.cpu_data: List[float] = []
-        self.memory_data: List[float] = []
-        self.disk_data: List[float] = []
-        self.network_sent_data: List[float] = []
-        self.network_recv_data: List[float] = []
+        self._graph_data = np.empty((5, self.max_data_points), dtype=np.float64)
+        self._graph_labels = [''] * self.max_data_points
+        self._graph_head = 0
+        self._graph_count = 0
+        self._graph_net_max = 0.0  # largest buffered network rate; None = rescan
+        
+        # Every sample the collector thread takes, drained once per GUI tick;
+        # if the GUI falls behind, only the newest max_data_points are kept
+        self._sample_queue = self.collector.subscribe(maxsize=self.max_data_points)
+        
+        # Exports render detached figure copies here, one at a time, so
+        # saving never blocks the Tk main loop
+        self._export_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+        # Historical range queries run here, separate from exports
+        self._hist_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hist-io")
+        self._stats_fig = None  # PDF statistics page, see _stats_page()
+        # Export options, shared by the real-time and historical export panels
+        self.export_resolution = tk.StringVar(value="Normal")  # key of _EXPORT_RESOLUTIONS
+        self.compress_pdf = tk.BooleanVar(value=bool(_GHOSTSCRIPT))
+        self._statistics_values = {}  # statistics tab label -> (values, text) shown
         
         # Historical data storage (limit in memory to prevent excessive usage)
-        self.historical_metrics: List[ResourceMetrics] = []
+        # Loaded samples are kept columnar: one row per sample, one column
+        # per _HISTORICAL_FIELDS entry, plus the timestamps as date numbers
+        self._hist_arr = np.empty((0, len(_HISTORICAL_FIELDS)))
+        self._hist_x = np.empty(0)
+        self._hist_series = {}  # axes -> [(line, column)], set up with the historical tab
+        self._hist_fmt_bucket = None  # index into _HIST_DATE_FORMATTERS in use
+        self._hist_aggregates = {}  # SQL aggregates over the whole loaded range
         self.max_historical_in_memory = 10000  # Limit historical data kept in memory
         
         # Performance optimization: batch canvas updates
         self._pending_graph_update = False
         self._pending_stats_update = False
         
+        # Blitting: real-time lines are animated artists redrawn over a cached
+        # axes background; full redraws (ticks, limits) only every few updates
+        self._blit_backgrounds = {}
+        self._graph_update_count = 0
+        self._label_refresh_every = 5
+        self._graph_tick_length = 0  # sample count the x ticks were laid out for
+        self._graphs_stale = False  # samples were added while the graphs were hidden
+        
         # Create GUI components
         self._create_widgets()
         
@@ -142,39 +388,44 @@ class ResourceMonitorGUI:
         title_label = tk.Label(
             main_frame,
             text="System Resource Monitor",
-            font=("Arial", 18, "bold"),
+            font=_FONT_TITLE,
             bg='#f0f0f0'
         )
         title_label.grid(row=0, column=0, pady=(0, 10), sticky=(tk.W, tk.E))
         
         # Create notebook for tabs
-        notebook = ttk.Notebook(main_frame)
-        notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Tab 1: Graphs
-        graphs_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(graphs_frame, text="Real-Time Graphs")
+        graphs_frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(graphs_frame, text="Real-Time Graphs")
         self._create_graphs_tab(graphs_frame)
         
         # Tab 2: Statistics
-        stats_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(stats_frame, text="Current Statistics")
+        stats_frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(stats_frame, text="Current Statistics")
         self._create_stats_tab(stats_frame)
         
-        # Tab 3: Historical Data
-        historical_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(historical_frame, text="Historical Data")
-        self._create_historical_tab(historical_frame)
+        # Tab 3: Historical Data. Its four figures and toolbars are only
+        # built when the tab is first opened (see _on_tab_changed)
+        self.historical_frame = ttk.Frame(self.notebook, padding="10")
+        self.notebook.add(self.historical_frame, text="Historical Data")
+        self._hist_built = False
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Status bar - make it more visible with a border/background
         status_frame = ttk.Frame(main_frame)
         status_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
         status_frame.columnconfigure(0, weight=1)
         
+        # Status text is a Tcl variable, so per-tick updates are a variable
+        # write rather than a widget reconfigure
+        self._status_var = tk.StringVar(value="Status: Initializing...")
         self.status_label = tk.Label(
             status_frame,
-            text="Status: Initializing...",
-            font=("Arial", 9),
+            textvariable=self._status_var,
+            font=_FONT_SMALL,
             bg='#e0e0e0',  # Slightly darker background for visibility
             fg='#000000',
             anchor=tk.W,
@@ -185,6 +436,12 @@ class ResourceMonitorGUI:
         )
         self.status_label.grid(row=0, column=0, sticky=(tk.W, tk.E))
     
+    def _on_tab_changed(self, event=None):
+        """Build the historical tab the first time it is selected."""
+        if not self._hist_built and self.notebook.select() == str(self.historical_frame):
+            self._hist_built = True
+            self._create_historical_tab(self.historical_frame)
+    
     def _create_graphs_tab(self, parent):
         """Create the graphs tab with real-time charts."""
         # Configure grid
@@ -194,57 +451,65 @@ class ResourceMonitorGUI:
         parent.rowconfigure(1, weight=1)
         parent.rowconfigure(2, weight=0)  # Export buttons row
         
+        # All four real-time graphs share one figure and canvas, so a tick
+        # renders and uploads one image to Tk instead of four
+        self.rt_fig = Figure(figsize=(10, 6), dpi=100, facecolor='white')
+        self.rt_fig.subplots_adjust(left=0.07, right=0.98, top=0.95, bottom=0.16, wspace=0.18, hspace=0.8)
+        (self.cpu_ax, self.memory_ax), (self.disk_ax, self.network_ax) = self.rt_fig.subplots(2, 2)
+        
         # CPU Graph
-        self.cpu_fig = Figure(figsize=(5, 3), dpi=100, facecolor='white')
-        self.cpu_ax = self.cpu_fig.add_subplot(111)
-        self.cpu_ax.set_title("CPU Usage (%)", fontsize=12, fontweight='bold')
+        self.cpu_ax.set_title("CPU Usage (%)", **_AXES_TITLE_STYLE)
         self.cpu_ax.set_ylim(0, 100)
         self.cpu_ax.set_xlabel("Time")
         self.cpu_ax.set_ylabel("Percentage (%)")
         self.cpu_ax.grid(True, alpha=0.3)
         self.cpu_line, = self.cpu_ax.plot([], [], 'b-', linewidth=2, label='CPU')
         self.cpu_ax.legend()
-        self.cpu_canvas = FigureCanvasTkAgg(self.cpu_fig, parent)
-        self.cpu_canvas.get_tk_widget().grid(row=0, column=0, padx=5, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Memory Graph
-        self.memory_fig = Figure(figsize=(5, 3), dpi=100, facecolor='white')
-        self.memory_ax = self.memory_fig.add_subplot(111)
-        self.memory_ax.set_title("Memory Usage (%)", fontsize=12, fontweight='bold')
+        self.memory_ax.set_title("Memory Usage (%)", **_AXES_TITLE_STYLE)
         self.memory_ax.set_ylim(0, 100)
         self.memory_ax.set_xlabel("Time")
         self.memory_ax.set_ylabel("Percentage (%)")
         self.memory_ax.grid(True, alpha=0.3)
         self.memory_line, = self.memory_ax.plot([], [], 'g-', linewidth=2, label='Memory')
         self.memory_ax.legend()
-        self.memory_canvas = FigureCanvasTkAgg(self.memory_fig, parent)
-        self.memory_canvas.get_tk_widget().grid(row=0, column=1, padx=5, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Disk Graph
-        self.disk_fig = Figure(figsize=(5, 3), dpi=100, facecolor='white')
-        self.disk_ax = self.disk_fig.add_subplot(111)
-        self.disk_ax.set_title("Disk Usage (%)", fontsize=12, fontweight='bold')
+        self.disk_ax.set_title("Disk Usage (%)", **_AXES_TITLE_STYLE)
         self.disk_ax.set_ylim(0, 100)
         self.disk_ax.set_xlabel("Time")
         self.disk_ax.set_ylabel("Percentage (%)")
         self.disk_ax.grid(True, alpha=0.3)
         self.disk_line, = self.disk_ax.plot([], [], 'r-', linewidth=2, label='Disk')
         self.disk_ax.legend()
-        self.disk_canvas = FigureCanvasTkAgg(self.disk_fig, parent)
-        self.disk_canvas.get_tk_widget().grid(row=1, column=0, padx=5, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Network Graph
-        self.network_fig = Figure(figsize=(5, 3), dpi=100, facecolor='white')
-        self.network_ax = self.network_fig.add_subplot(111)
-        self.network_ax.set_title("Network Usage (Mbps)", fontsize=12, fontweight='bold')
+        self.network_ax.set_title("Network Usage (Mbps)", **_AXES_TITLE_STYLE)
         self.network_ax.set_xlabel("Time")
         self.network_ax.set_ylabel("Rate (Mbps)")
         self.network_ax.grid(True, alpha=0.3)
         self.network_sent_line, = self.network_ax.plot([], [], 'c-', linewidth=2, label='Sent')
         self.network_recv_line, = self.network_ax.plot([], [], 'm-', linewidth=2, label='Received')
         self.network_ax.legend()
-        self.network_canvas = FigureCanvasTkAgg(self.network_fig, parent)
-        self.network_canvas.get_tk_widget().grid(row=1, column=1, padx=5, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        self.rt_canvas = FigureCanvasTkAgg(self.rt_fig, parent)
+        self.rt_canvas.get_tk_widget().grid(row=0, column=0, rowspan=2, columnspan=2, padx=5, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # (axes, lines) of each real-time graph. Lines are animated so full
+        # draws leave them out of the cached backgrounds; every full draw
+        # (including the ones triggered by resizing) re-captures them
+        self._realtime_views = [
+            (self.cpu_ax, [self.cpu_line]),
+            (self.memory_ax, [self.memory_line]),
+            (self.disk_ax, [self.disk_line]),
+            (self.network_ax, [self.network_sent_line, self.network_recv_line])
+        ]
+        for ax, lines in self._realtime_views:
+            ax.tick_params(axis='x', labelrotation=45)  # new tick labels inherit it
+            for line in lines:
+                line.set_animated(True)
+        self.rt_canvas.mpl_connect('draw_event', self._on_realtime_draw)
         
         # Export buttons frame
         export_frame = ttk.LabelFrame(parent, text="Export Real-Time Graphs", padding="10")
@@ -252,10 +517,31 @@ class ResourceMonitorGUI:
         
         ttk.Button(export_frame, text="Export All Graphs as PDF", command=self._export_realtime_all_pdf).pack(side=tk.LEFT, padx=5)
         # Real-time graphs are always available (is_historical=False)
-        ttk.Button(export_frame, text="Export CPU as JPEG", command=lambda: self._export_single_graph(self.cpu_fig, "CPU_Usage", "JPEG", is_historical=False)).pack(side=tk.LEFT, padx=5)
-        ttk.Button(export_frame, text="Export Memory as JPEG", command=lambda: self._export_single_graph(self.memory_fig, "Memory_Usage", "JPEG", is_historical=False)).pack(side=tk.LEFT, padx=5)
-        ttk.Button(export_frame, text="Export Disk as JPEG", command=lambda: self._export_single_graph(self.disk_fig, "Disk_Usage", "JPEG", is_historical=False)).pack(side=tk.LEFT, padx=5)
-        ttk.Button(export_frame, text="Export Network as JPEG", command=lambda: self._export_single_graph(self.network_fig, "Network_Usage", "JPEG", is_historical=False)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(export_frame, text="Export CPU as JPEG", command=lambda: self._export_single_graph(self.cpu_ax, "CPU_Usage", "JPEG", is_historical=False)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(export_frame, text="Export Memory as JPEG", command=lambda: self._export_single_graph(self.memory_ax, "Memory_Usage", "JPEG", is_historical=False)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(export_frame, text="Export Disk as JPEG", command=lambda: self._export_single_graph(self.disk_ax, "Disk_Usage", "JPEG", is_historical=False)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(export_frame, text="Export Network as JPEG", command=lambda: self._export_single_graph(self.network_ax, "Network_Usage", "JPEG", is_historical=False)).pack(side=tk.LEFT, padx=5)
+        self._create_export_options(export_frame)
+    
+    def _create_export_options(self, parent):
+        """Add the JPEG resolution choice and the "Compress PDF" checkbox.
+        
+        The checkbox is disabled when Ghostscript is not installed.
+        """
+        ttk.Label(parent, text="JPEG Resolution:").pack(side=tk.LEFT, padx=(15, 2))
+        ttk.Combobox(
+            parent,
+            textvariable=self.export_resolution,
+            values=list(_EXPORT_RESOLUTIONS),
+            state="readonly",
+            width=7
+        ).pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(
+            parent,
+            text="Compress PDF (Ghostscript)" if _GHOSTSCRIPT else "Compress PDF (Ghostscript not found)",
+            variable=self.compress_pdf,
+            state=tk.NORMAL if _GHOSTSCRIPT else tk.DISABLED
+        ).pack(side=tk.LEFT, padx=5)
     
     def _create_stats_tab(self, parent):
         """Create the statistics tab with current values."""
@@ -270,7 +556,7 @@ class ResourceMonitorGUI:
         self.cpu_percent_label = tk.Label(
             cpu_frame,
             text="Usage: 0.0%",
-            font=("Arial", 14, "bold"),
+            font=_FONT_HEADING,
             fg='blue'
         )
         self.cpu_percent_label.pack(anchor=tk.W)
@@ -282,7 +568,7 @@ class ResourceMonitorGUI:
         self.memory_percent_label = tk.Label(
             memory_frame,
             text="Usage: 0.0%",
-            font=("Arial", 14, "bold"),
+            font=_FONT_HEADING,
             fg='green'
         )
         self.memory_percent_label.pack(anchor=tk.W)
@@ -290,7 +576,7 @@ class ResourceMonitorGUI:
         self.memory_details_label = tk.Label(
             memory_frame,
             text="Used: 0 MB / Total: 0 MB",
-            font=("Arial", 11)
+            font=_FONT_BODY
         )
         self.memory_details_label.pack(anchor=tk.W, pady=(5, 0))
         
@@ -301,7 +587,7 @@ class ResourceMonitorGUI:
         self.disk_percent_label = tk.Label(
             disk_frame,
             text="Usage: 0.0%",
-            font=("Arial", 14, "bold"),
+            font=_FONT_HEADING,
             fg='red'
         )
         self.disk_percent_label.pack(anchor=tk.W)
@@ -309,7 +595,7 @@ class ResourceMonitorGUI:
         self.disk_details_label = tk.Label(
             disk_frame,
             text="Used: 0.00 GB / Total: 0.00 GB",
-            font=("Arial", 11)
+            font=_FONT_BODY
         )
         self.disk_details_label.pack(anchor=tk.W, pady=(5, 0))
         
@@ -320,7 +606,7 @@ class ResourceMonitorGUI:
         self.network_sent_label = tk.Label(
             network_frame,
             text="Sent: 0.00 MB (Rate: 0.00 Mbps)",
-            font=("Arial", 11),
+            font=_FONT_BODY,
             fg='cyan'
         )
         self.network_sent_label.pack(anchor=tk.W)
@@ -328,7 +614,7 @@ class ResourceMonitorGUI:
         self.network_recv_label = tk.Label(
             network_frame,
             text="Received: 0.00 MB (Rate: 0.00 Mbps)",
-            font=("Arial", 11),
+            font=_FONT_BODY,
             fg='magenta'
         )
         self.network_recv_label.pack(anchor=tk.W, pady=(5, 0))
@@ -337,7 +623,7 @@ class ResourceMonitorGUI:
         self.timestamp_label = tk.Label(
             stats_container,
             text="Last Update: --",
-            font=("Arial", 9),
+            font=_FONT_SMALL,
             fg='gray'
         )
         self.timestamp_label.pack(side=tk.BOTTOM, pady=10)
@@ -348,17 +634,22 @@ class ResourceMonitorGUI:
         control_frame = ttk.LabelFrame(parent, text="Time Range Selection", padding="10")
         control_frame.pack(fill=tk.X, padx=5, pady=5)
         
+        # Default range is the last hour, taken from a single clock reading
+        now = datetime.now()
+        start_date, start_time = (now - timedelta(hours=1)).isoformat(" ", "seconds").split()
+        end_date, end_time = now.isoformat(" ", "seconds").split()
+        
         # Start time
         ttk.Label(control_frame, text="Start Time:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
-        self.hist_start_date = tk.StringVar(value=(datetime.now() - timedelta(hours=1)).strftime("%Y-%m-%d"))
-        self.hist_start_time = tk.StringVar(value=(datetime.now() - timedelta(hours=1)).strftime("%H:%M:%S"))
+        self.hist_start_date = tk.StringVar(value=start_date)
+        self.hist_start_time = tk.StringVar(value=start_time)
         ttk.Entry(control_frame, textvariable=self.hist_start_date, width=12).grid(row=0, column=1, padx=2)
         ttk.Entry(control_frame, textvariable=self.hist_start_time, width=10).grid(row=0, column=2, padx=2)
         
         # End time
         ttk.Label(control_frame, text="End Time:").grid(row=0, column=3, padx=5, pady=5, sticky=tk.W)
-        self.hist_end_date = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
-        self.hist_end_time = tk.StringVar(value=datetime.now().strftime("%H:%M:%S"))
+        self.hist_end_date = tk.StringVar(value=end_date)
+        self.hist_end_time = tk.StringVar(value=end_time)
         ttk.Entry(control_frame, textvariable=self.hist_end_date, width=12).grid(row=0, column=4, padx=2)
         ttk.Entry(control_frame, textvariable=self.hist_end_time, width=10).grid(row=0, column=5, padx=2)
         
@@ -371,13 +662,15 @@ class ResourceMonitorGUI:
         ttk.Button(quick_frame, text="All Data", command=self._set_time_range_all).pack(side=tk.LEFT, padx=2)
         
         # Load button
-        ttk.Button(control_frame, text="Load Historical Data", command=self._load_historical_data).grid(row=0, column=7, padx=10)
+        self.hist_load_button = ttk.Button(control_frame, text="Load Historical Data", command=self._load_historical_data)
+        self.hist_load_button.grid(row=0, column=7, padx=10)
         
         # Info label
+        self._hist_info_var = tk.StringVar(value="Select time range and click 'Load Historical Data'")
         self.hist_info_label = tk.Label(
             control_frame,
-            text="Select time range and click 'Load Historical Data'",
-            font=("Arial", 9),
+            textvariable=self._hist_info_var,
+            font=_FONT_SMALL,
             fg='gray'
         )
         self.hist_info_label.grid(row=1, column=0, columnspan=8, pady=5)
@@ -390,14 +683,15 @@ class ResourceMonitorGUI:
         export_row1 = ttk.Frame(hist_export_frame)
         export_row1.pack(fill=tk.X, pady=(0, 5))
         ttk.Button(export_row1, text="Export All as PDF", command=self._export_historical_all_pdf).pack(side=tk.LEFT, padx=5)
-        ttk.Button(export_row1, text="Export CPU as JPEG", command=lambda: self._export_single_graph(self.hist_cpu_fig, "Historical_CPU_Usage", "JPEG", is_historical=True)).pack(side=tk.LEFT, padx=5)
-        ttk.Button(export_row1, text="Export Memory as JPEG", command=lambda: self._export_single_graph(self.hist_memory_fig, "Historical_Memory_Usage", "JPEG", is_historical=True)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(export_row1, text="Export CPU as JPEG", command=lambda: self._export_single_graph(self.hist_cpu_ax, "Historical_CPU_Usage", "JPEG", is_historical=True)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(export_row1, text="Export Memory as JPEG", command=lambda: self._export_single_graph(self.hist_memory_ax, "Historical_Memory_Usage", "JPEG", is_historical=True)).pack(side=tk.LEFT, padx=5)
         
         # Second row of export buttons
         export_row2 = ttk.Frame(hist_export_frame)
         export_row2.pack(fill=tk.X)
-        ttk.Button(export_row2, text="Export Disk as JPEG", command=lambda: self._export_single_graph(self.hist_disk_fig, "Historical_Disk_Usage", "JPEG", is_historical=True)).pack(side=tk.LEFT, padx=5)
-        ttk.Button(export_row2, text="Export Network as JPEG", command=lambda: self._export_single_graph(self.hist_network_fig, "Historical_Network_Usage", "JPEG", is_historical=True)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(export_row2, text="Export Disk as JPEG", command=lambda: self._export_single_graph(self.hist_disk_ax, "Historical_Disk_Usage", "JPEG", is_historical=True)).pack(side=tk.LEFT, padx=5)
+        ttk.Button(export_row2, text="Export Network as JPEG", command=lambda: self._export_single_graph(self.hist_network_ax, "Historical_Network_Usage", "JPEG", is_historical=True)).pack(side=tk.LEFT, padx=5)
+        self._create_export_options(export_row2)
         
         # Graphs container - now it won't hide the export buttons
         graphs_container = ttk.Frame(parent)
@@ -415,9 +709,15 @@ class ResourceMonitorGUI:
         cpu_frame.rowconfigure(1, weight=0)  # Toolbar row
         self.hist_cpu_fig = Figure(figsize=(6, 4), dpi=100, facecolor='white')
         self.hist_cpu_ax = self.hist_cpu_fig.add_subplot(111)
-        self.hist_cpu_ax.set_title("Historical CPU Usage (%)", fontsize=12, fontweight='bold')
+        self.hist_cpu_ax.set_title("Historical CPU Usage (%)", **_AXES_TITLE_STYLE)
+        self.hist_cpu_ax.set_xlabel("Time")
         self.hist_cpu_ax.set_ylabel("Percentage (%)")
+        self.hist_cpu_ax.set_ylim(0, 100)
         self.hist_cpu_ax.grid(True, alpha=0.3)
+        self.hist_cpu_ax.xaxis_date()
+        self.hist_cpu_line, = self.hist_cpu_ax.plot([], [], 'b-', linewidth=1.5, label='CPU')
+        self.hist_cpu_ax.legend()
+        self.hist_cpu_fig.autofmt_xdate()  # new ticks inherit the rotation
         self.hist_cpu_canvas = FigureCanvasTkAgg(self.hist_cpu_fig, cpu_frame)
         self.hist_cpu_canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         # Toolbar in separate frame that uses pack
@@ -434,9 +734,15 @@ class ResourceMonitorGUI:
         memory_frame.rowconfigure(1, weight=0)  # Toolbar row
         self.hist_memory_fig = Figure(figsize=(6, 4), dpi=100, facecolor='white')
         self.hist_memory_ax = self.hist_memory_fig.add_subplot(111)
-        self.hist_memory_ax.set_title("Historical Memory Usage (%)", fontsize=12, fontweight='bold')
+        self.hist_memory_ax.set_title("Historical Memory Usage (%)", **_AXES_TITLE_STYLE)
+        self.hist_memory_ax.set_xlabel("Time")
         self.hist_memory_ax.set_ylabel("Percentage (%)")
+        self.hist_memory_ax.set_ylim(0, 100)
         self.hist_memory_ax.grid(True, alpha=0.3)
+        self.hist_memory_ax.xaxis_date()
+        self.hist_memory_line, = self.hist_memory_ax.plot([], [], 'g-', linewidth=1.5, label='Memory')
+        self.hist_memory_ax.legend()
+        self.hist_memory_fig.autofmt_xdate()  # new ticks inherit the rotation
         self.hist_memory_canvas = FigureCanvasTkAgg(self.hist_memory_fig, memory_frame)
         self.hist_memory_canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         # Toolbar in separate frame that uses pack
@@ -453,9 +759,15 @@ class ResourceMonitorGUI:
         disk_frame.rowconfigure(1, weight=0)  # Toolbar row
         self.hist_disk_fig = Figure(figsize=(6, 4), dpi=100, facecolor='white')
         self.hist_disk_ax = self.hist_disk_fig.add_subplot(111)
-        self.hist_disk_ax.set_title("Historical Disk Usage (%)", fontsize=12, fontweight='bold')
+        self.hist_disk_ax.set_title("Historical Disk Usage (%)", **_AXES_TITLE_STYLE)
+        self.hist_disk_ax.set_xlabel("Time")
         self.hist_disk_ax.set_ylabel("Percentage (%)")
+        self.hist_disk_ax.set_ylim(0, 100)
         self.hist_disk_ax.grid(True, alpha=0.3)
+        self.hist_disk_ax.xaxis_date()
+        self.hist_disk_line, = self.hist_disk_ax.plot([], [], 'r-', linewidth=1.5, label='Disk')
+        self.hist_disk_ax.legend()
+        self.hist_disk_fig.autofmt_xdate()  # new ticks inherit the rotation
         self.hist_disk_canvas = FigureCanvasTkAgg(self.hist_disk_fig, disk_frame)
         self.hist_disk_canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         # Toolbar in separate frame that uses pack
@@ -472,9 +784,15 @@ class ResourceMonitorGUI:
         network_frame.rowconfigure(1, weight=0)  # Toolbar row
         self.hist_network_fig = Figure(figsize=(6, 4), dpi=100, facecolor='white')
         self.hist_network_ax = self.hist_network_fig.add_subplot(111)
-        self.hist_network_ax.set_title("Historical Network Usage (Mbps)", fontsize=12, fontweight='bold')
+        self.hist_network_ax.set_title("Historical Network Usage (Mbps)", **_AXES_TITLE_STYLE)
+        self.hist_network_ax.set_xlabel("Time")
         self.hist_network_ax.set_ylabel("Rate (Mbps)")
         self.hist_network_ax.grid(True, alpha=0.3)
+        self.hist_network_ax.xaxis_date()
+        self.hist_network_sent_line, = self.hist_network_ax.plot([], [], 'c-', linewidth=1.5, label='Sent')
+        self.hist_network_recv_line, = self.hist_network_ax.plot([], [], 'm-', linewidth=1.5, label='Received')
+        self.hist_network_ax.legend()
+        self.hist_network_fig.autofmt_xdate()  # new ticks inherit the rotation
         self.hist_network_canvas = FigureCanvasTkAgg(self.hist_network_fig, network_frame)
         self.hist_network_canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         # Toolbar in separate frame that uses pack
@@ -483,6 +801,19 @@ class ResourceMonitorGUI:
         hist_network_toolbar = NavigationToolbar2Tk(self.hist_network_canvas, network_toolbar_frame)
         hist_network_toolbar.update()
         
+        # Lines of each historical graph with their column in _hist_arr
+        # (ordered as _HISTORICAL_FIELDS). The lines persist across loads;
+        # any x range change, from loading or from the toolbar's zoom and
+        # pan, re-downsamples them to the visible range
+        self._hist_series = {
+            self.hist_cpu_ax: [(self.hist_cpu_line, 0)],
+            self.hist_memory_ax: [(self.hist_memory_line, 1)],
+            self.hist_disk_ax: [(self.hist_disk_line, 2)],
+            self.hist_network_ax: [(self.hist_network_sent_line, 3), (self.hist_network_recv_line, 4)]
+        }
+        for ax in self._hist_series:
+            ax.callbacks.connect('xlim_changed', self._on_historical_xlim_changed)
+        
         # Statistics panel - placed after graphs
         stats_panel = ttk.LabelFrame(parent, text="Statistics for Selected Range", padding="10")
         stats_panel.pack(fill=tk.X, padx=5, pady=5)
@@ -490,29 +821,34 @@ class ResourceMonitorGUI:
         self.hist_stats_label = tk.Label(
             stats_panel,
             text="Load data to see statistics",
-            font=("Arial", 10),
+            font=_FONT_STATS,
             justify=tk.LEFT
         )
         self.hist_stats_label.pack(anchor=tk.W)
     
+    def _set_range_fields(self, start_time: datetime, end_time: datetime):
+        """Fill the start/end date and time entries from two datetimes.
+        
+        isoformat() yields the same "YYYY-MM-DD HH:MM:SS" text as the entry
+        format without going through strftime's format parser.
+        """
+        start_date, start_clock = start_time.isoformat(" ", "seconds").split()
+        end_date, end_clock = end_time.isoformat(" ", "seconds").split()
+        self.hist_start_date.set(start_date)
+        self.hist_start_time.set(start_clock)
+        self.hist_end_date.set(end_date)
+        self.hist_end_time.set(end_clock)
+    
     def _set_time_range(self, hours: int):
         """Set time range to last N hours."""
         end_time = datetime.now()
-        start_time = end_time - timedelta(hours=hours)
-        
-        self.hist_start_date.set(start_time.strftime("%Y-%m-%d"))
-        self.hist_start_time.set(start_time.strftime("%H:%M:%S"))
-        self.hist_end_date.set(end_time.strftime("%Y-%m-%d"))
-        self.hist_end_time.set(end_time.strftime("%H:%M:%S"))
+        self._set_range_fields(end_time - timedelta(hours=hours), end_time)
     
     def _set_time_range_all(self):
         """Set time range to all available data."""
         stats = self.db_storage.get_statistics()
         if stats.get('oldest_timestamp') and stats.get('newest_timestamp'):
-            self.hist_start_date.set(stats['oldest_timestamp'].strftime("%Y-%m-%d"))
-            self.hist_start_time.set(stats['oldest_timestamp'].strftime("%H:%M:%S"))
-            self.hist_end_date.set(stats['newest_timestamp'].strftime("%Y-%m-%d"))
-            self.hist_end_time.set(stats['newest_timestamp'].strftime("%H:%M:%S"))
+            self._set_range_fields(stats['oldest_timestamp'], stats['newest_timestamp'])
         else:
             messagebox.showinfo("Info", "No historical data available yet.")
     
@@ -520,12 +856,9 @@ class ResourceMonitorGUI:
         """Load historical data from database for selected time range."""
         try:
             # Parse start and end times with validation
-            start_str = f"{self.hist_start_date.get()} {self.hist_start_time.get()}"
-            end_str = f"{self.hist_end_date.get()} {self.hist_end_time.get()}"
-            
             try:
-                start_time = datetime.strptime(start_str, "%Y-%m-%d %H:%M:%S")
-                end_time = datetime.strptime(end_str, "%Y-%m-%d %H:%M:%S")
+                start_time = _parse_datetime_input(self.hist_start_date.get(), self.hist_start_time.get())
+                end_time = _parse_datetime_input(self.hist_end_date.get(), self.hist_end_time.get())
             except ValueError as ve:
                 messagebox.showerror("Error", f"Invalid date/time format.\n\nExpected format: YYYY-MM-DD HH:MM:SS\nExample: 2026-01-09 14:30:00\n\nError: {ve}")
                 return
@@ -546,45 +879,74 @@ class ResourceMonitorGUI:
                 if not response:
                     return
             
-            # Load data from database with progress indication
-            self.hist_info_label.config(text="Loading data from database... Please wait.")
-            self.root.update()
+            # Show progress without pumping the event loop (which could run
+            # this handler again); the button stays disabled until the
+            # results are applied
+            self._hist_info_var.set("Loading data from database... Please wait.")
+            self.hist_load_button.config(state=tk.DISABLED)
+            self.root.update_idletasks()
             
-            # Load in a separate thread to avoid blocking UI
-            def load_data():
-                try:
-                    metrics = self.db_storage.get_metrics_by_time_range(start_time, end_time)
-                    
-                    # Limit stored metrics in memory
-                    if len(metrics) > self.max_historical_in_memory:
-                        # Keep only most recent N metrics
-                        metrics = metrics[-self.max_historical_in_memory:]
-                        self.hist_info_label.config(
-                            text=f"Warning: Only showing last {self.max_historical_in_memory:,} of {len(metrics):,} records for performance."
-                        )
-                    
-                    self.historical_metrics = metrics
-                    
-                    # Update graphs and statistics on main thread
-                    self.root.after(0, self._update_after_load, start_time, end_time)
-                except Exception as e:
-                    self.root.after(0, lambda: messagebox.showerror("Error", f"Error loading data: {e}"))
-                    self.root.after(0, lambda: self.hist_info_label.config(text="Error loading data"))
-            
-            # Start loading in background
-            import threading
-            thread = threading.Thread(target=load_data, daemon=True)
-            thread.start()
+            # Load on the historical worker to avoid blocking UI
+            self._hist_pool.submit(self._fetch_historical_data, start_time, end_time)
             
         except Exception as e:
             messagebox.showerror("Error", f"Unexpected error: {e}")
-            self.hist_info_label.config(text="Error loading data")
+            self._hist_info_var.set("Error loading data")
+    
+    def _fetch_historical_data(self, start_time: datetime, end_time: datetime):
+        """Query a historical range on the historical worker and post the results to Tk.
+        
+        Only the database queries and array conversions run here; all widget
+        and state updates happen in _apply_hist_results() on the main thread.
+        """
+        try:
+            # Columnar query for only the charted fields, limited in SQL to
+            # the most recent N samples so older rows are never read
+            arrays = self.db_storage.get_metrics_arrays(
+                start_time, end_time, self.max_historical_in_memory,
+                columns=_HISTORICAL_FIELDS, newest=True
+            )
+            hist_arr = np.column_stack([arrays[name] for name in _HISTORICAL_FIELDS])
+            # Matplotlib date numbers, converted in one vectorised call so
+            # plotting never converts timestamps point by point
+            hist_x = date2num(arrays['timestamp'])
+            
+            # Statistics cover the whole range and are computed by SQLite, so
+            # they don't depend on the in-memory limit
+            aggregates = self.db_storage.get_aggregates_by_time_range(start_time, end_time)
+        except Exception as e:
+            self.root.after(0, self._on_hist_load_failed, e)
+        else:
+            # Update graphs and statistics on main thread
+            self.root.after(
+                0, self._apply_hist_results,
+                hist_arr, hist_x, aggregates, start_time, end_time
+            )
     
-    def _update_after_load(self, start_time: datetime, end_time: datetime):
-        """Update graphs and statistics after data is loaded."""
-        if not self.historical_metrics:
+    def _on_hist_load_failed(self, error: Exception):
+        """Report a failed historical load (runs on the main thread)."""
+        self.hist_load_button.config(state=tk.NORMAL)
+        messagebox.showerror("Error", f"Error loading data: {error}")
+        self._hist_info_var.set("Error loading data")
+    
+    def _apply_hist_results(
+        self,
+        hist_arr: np.ndarray,
+        hist_x: np.ndarray,
+        aggregates: dict,
+        start_time: datetime,
+        end_time: datetime
+    ):
+        """Install loaded historical data and update graphs and statistics."""
+        self.hist_load_button.config(state=tk.NORMAL)
+        self._hist_arr = hist_arr
+        self._hist_x = hist_x
+        self._hist_aggregates = aggregates
+        
+        if not hist_x.size:
+            self._update_historical_statistics()
             messagebox.showinfo("Info", "No data found for the selected time range.")
-            self.hist_info_label.config(text="No data found for selected range")
+            self._hist_info_var.set("No data found for selected range")
             return
         
         # Update graphs
@@ -594,159 +956,107 @@ class ResourceMonitorGUI:
         self._update_historical_statistics()
         
         # Update info
-        total_records = len(self.historical_metrics)
+        total_records = aggregates.get('count', hist_x.size)
         if total_records > self.max_historical_in_memory:
-            self.hist_info_label.config(
-                text=f"Loaded {total_records:,} records (showing last {self.max_historical_in_memory:,}) from {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}"
+            self._hist_info_var.set(
+                f"Loaded {total_records:,} records (showing last {self.max_historical_in_memory:,}) from {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}"
             )
         else:
-            self.hist_info_label.config(
-                text=f"Loaded {total_records:,} records from {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}"
+            self._hist_info_var.set(
+                f"Loaded {total_records:,} records from {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}"
             )
     
     def _update_historical_graphs(self):
-        """Update historical graphs with loaded data."""
-        if not self.historical_metrics:
-            return
+        """Update historical graphs with loaded data.
         
-        # Limit data points if too many for better performance
-        # Sample data if more than threshold to avoid slow rendering
-        max_points_for_display = 5000
-        if len(self.historical_metrics) > max_points_for_display:
-            # Sample every Nth point for display
-            step = len(self.historical_metrics) // max_points_for_display
-            sampled_metrics = self.historical_metrics[::step]
-        else:
-            sampled_metrics = self.historical_metrics
-        
-        # Extract data from sampled metrics
-        timestamps = [m.timestamp for m in sampled_metrics]
-        cpu_values = [m.cpu_percent for m in sampled_metrics]
-        memory_values = [m.memory_percent for m in sampled_metrics]
-        disk_values = [m.disk_percent for m in sampled_metrics]
-        network_sent = [m.network_sent_rate_mbps for m in sampled_metrics]
-        network_recv = [m.network_recv_rate_mbps for m in sampled_metrics]
-        
-        # Determine time range to format X-axis appropriately
-        if timestamps:
-            time_span = (timestamps[-1] - timestamps[0]).total_seconds()
-            if time_span > 86400:  # More than 1 day
-                date_format = '%Y-%m-%d\n%H:%M'
-            elif time_span > 3600:  # More than 1 hour
-                date_format = '%m-%d %H:%M'
-            else:  # Less than 1 hour
-                date_format = '%H:%M:%S'
-        else:
-            date_format = '%H:%M:%S'
+        The lines (and the tick label rotation) are set up once with the
+        tab; a load only replaces their data and adjusts the axis limits and
+        date format.
+        """
+        if not self._hist_x.size:
+            return
         
-        # Update CPU graph
-        self.hist_cpu_ax.clear()
-        self.hist_cpu_ax.plot(timestamps, cpu_values, 'b-', linewidth=1.5, label='CPU')
-        self.hist_cpu_ax.set_title("Historical CPU Usage (%)", fontsize=12, fontweight='bold')
-        self.hist_cpu_ax.set_xlabel("Time")
-        self.hist_cpu_ax.set_ylabel("Percentage (%)")
-        self.hist_cpu_ax.set_ylim(0, 100)
-        if timestamps:
-            self.hist_cpu_ax.set_xlim(timestamps[0], timestamps[-1])
-        self.hist_cpu_ax.grid(True, alpha=0.3)
-        self.hist_cpu_ax.legend()
-        self.hist_cpu_ax.xaxis.set_major_formatter(DateFormatter(date_format))
-        self.hist_cpu_fig.autofmt_xdate()
-        self.hist_cpu_canvas.draw()
-        
-        # Update Memory graph
-        self.hist_memory_ax.clear()
-        self.hist_memory_ax.plot(timestamps, memory_values, 'g-', linewidth=1.5, label='Memory')
-        self.hist_memory_ax.set_title("Historical Memory Usage (%)", fontsize=12, fontweight='bold')
-        self.hist_memory_ax.set_xlabel("Time")
-        self.hist_memory_ax.set_ylabel("Percentage (%)")
-        self.hist_memory_ax.set_ylim(0, 100)
-        if timestamps:
-            self.hist_memory_ax.set_xlim(timestamps[0], timestamps[-1])
-        self.hist_memory_ax.grid(True, alpha=0.3)
-        self.hist_memory_ax.legend()
-        self.hist_memory_ax.xaxis.set_major_formatter(DateFormatter(date_format))
-        self.hist_memory_fig.autofmt_xdate()
-        self.hist_memory_canvas.draw()
-        
-        # Update Disk graph
-        self.hist_disk_ax.clear()
-        self.hist_disk_ax.plot(timestamps, disk_values, 'r-', linewidth=1.5, label='Disk')
-        self.hist_disk_ax.set_title("Historical Disk Usage (%)", fontsize=12, fontweight='bold')
-        self.hist_disk_ax.set_xlabel("Time")
-        self.hist_disk_ax.set_ylabel("Percentage (%)")
-        max_disk = max(disk_values) if disk_values else 100
+        # Value columns come from the array built at load time. Each series
+        # is downsampled (LTTB) to about two points per pixel of plot width
+        # before plotting, since more segments than pixels only cost drawing
+        # time; zooming in re-downsamples the visible part
+        x = self._hist_x
+        cpu_values, memory_values, disk_values, network_sent, network_recv = self._hist_arr.T
+        
+        # Determine time range to format X-axis appropriately; formatters
+        # are only replaced when the span falls into another bucket
+        time_span = (x[-1] - x[0]) * 86400
+        bucket = 0 if time_span <= 3600 else 1 if time_span <= 86400 else 2
+        if bucket != self._hist_fmt_bucket:
+            self._hist_fmt_bucket = bucket
+            for ax in self._hist_series:
+                ax.xaxis.set_major_formatter(_HIST_DATE_FORMATTERS[bucket])
+        
+        max_disk = disk_values.max()
         self.hist_disk_ax.set_ylim(0, max(max_disk * 1.1, 10))
-        if timestamps:
-            self.hist_disk_ax.set_xlim(timestamps[0], timestamps[-1])
-        self.hist_disk_ax.grid(True, alpha=0.3)
-        self.hist_disk_ax.legend()
-        self.hist_disk_ax.xaxis.set_major_formatter(DateFormatter(date_format))
-        self.hist_disk_fig.autofmt_xdate()
-        self.hist_disk_canvas.draw()
-        
-        # Update Network graph
-        self.hist_network_ax.clear()
-        self.hist_network_ax.plot(timestamps, network_sent, 'c-', linewidth=1.5, label='Sent')
-        self.hist_network_ax.plot(timestamps, network_recv, 'm-', linewidth=1.5, label='Received')
-        self.hist_network_ax.set_title("Historical Network Usage (Mbps)", fontsize=12, fontweight='bold')
-        self.hist_network_ax.set_xlabel("Time")
-        self.hist_network_ax.set_ylabel("Rate (Mbps)")
-        max_network = max(max(network_sent) if network_sent else 0, max(network_recv) if network_recv else 0, 1)
+        max_network = max(network_sent.max(), network_recv.max(), 1)
         self.hist_network_ax.set_ylim(0, max_network * 1.1)
-        if timestamps:
-            self.hist_network_ax.set_xlim(timestamps[0], timestamps[-1])
-        self.hist_network_ax.grid(True, alpha=0.3)
-        self.hist_network_ax.legend()
-        self.hist_network_ax.xaxis.set_major_formatter(DateFormatter(date_format))
-        self.hist_network_fig.autofmt_xdate()
-        self.hist_network_canvas.draw()
+        
+        # Setting the x range fires _on_historical_xlim_changed, which puts
+        # the downsampled data into the lines
+        for ax in self._hist_series:
+            ax.set_xlim(x[0], x[-1])
+            ax.figure.canvas.draw_idle()
+    
+    def _historical_plot_points(self, canvas: FigureCanvasTkAgg) -> int:
+        """Return how many points to plot per series: two per pixel of width."""
+        return 2 * max(canvas.get_tk_widget().winfo_width(), 800)
+    
+    def _on_historical_xlim_changed(self, ax):
+        """Re-downsample a historical graph's lines to its new x range (zoom/pan)."""
+        series = self._hist_series.get(ax)
+        if not series:
+            return
+        x = self._hist_x
+        low, high = ax.get_xlim()
+        # One extra point on each side so lines run to the edges of the view
+        first = max(int(np.searchsorted(x, low)) - 1, 0)
+        last = min(int(np.searchsorted(x, high, side='right')) + 1, len(x))
+        n_out = self._historical_plot_points(ax.figure.canvas)
+        for line, column in series:
+            values = self._hist_arr[:, column]
+            keep = first + _lttb(x[first:last], values[first:last], n_out)
+            line.set_data(x[keep], values[keep])
     
     def _update_historical_statistics(self):
         """Update statistics panel with data for selected range."""
-        if not self.historical_metrics:
+        aggregates = self._hist_aggregates
+        if not self._hist_x.size or not aggregates.get('count'):
+            # Don't leave the previous range's numbers on show
+            self.hist_stats_label.config(text="No data in selected range")
             return
         
-        # Calculate statistics
-        cpu_values = [m.cpu_percent for m in self.historical_metrics]
-        memory_values = [m.memory_percent for m in self.historical_metrics]
-        disk_values = [m.disk_percent for m in self.historical_metrics]
-        network_sent = [m.network_sent_rate_mbps for m in self.historical_metrics]
-        network_recv = [m.network_recv_rate_mbps for m in self.historical_metrics]
-        
-        stats_text = f"Records: {len(self.historical_metrics)}\n\n"
-        stats_text += f"CPU - Avg: {sum(cpu_values)/len(cpu_values):.2f}%, "
-        stats_text += f"Min: {min(cpu_values):.2f}%, Max: {max(cpu_values):.2f}%\n"
-        stats_text += f"Memory - Avg: {sum(memory_values)/len(memory_values):.2f}%, "
-        stats_text += f"Min: {min(memory_values):.2f}%, Max: {max(memory_values):.2f}%\n"
-        stats_text += f"Disk - Avg: {sum(disk_values)/len(disk_values):.2f}%, "
-        stats_text += f"Min: {min(disk_values):.2f}%, Max: {max(disk_values):.2f}%\n"
-        stats_text += f"Network Sent - Avg: {sum(network_sent)/len(network_sent):.2f} Mbps, "
-        stats_text += f"Max: {max(network_sent):.2f} Mbps\n"
-        stats_text += f"Network Received - Avg: {sum(network_recv)/len(network_recv):.2f} Mbps, "
-        stats_text += f"Max: {max(network_recv):.2f} Mbps"
+        # Statistics were aggregated by SQLite when the range was loaded
+        stats_text = _HIST_STATS_TEMPLATE.format_map(aggregates)
         
         self.hist_stats_label.config(text=stats_text)
     
-    def _export_single_graph(self, figure: Figure, default_name: str, file_format: str, is_historical: bool = False):
+    def _export_single_graph(self, ax: Axes, default_name: str, file_format: str, is_historical: bool = False):
         """
         Export a single graph to JPEG or PDF file.
         
         Args:
-            figure: Matplotlib Figure object to export
+            ax: Matplotlib Axes of the graph to export; only this graph is
+                saved when its figure holds several
             default_name: Default filename (without extension)
             file_format: File format ('JPEG' or 'PDF')
             is_historical: If True, check if historical data is loaded before exporting
         """
         try:
             # Validate inputs
-            if figure is None or len(figure.axes) == 0:
+            if ax is None:
                 messagebox.showerror("Error", "Cannot export: Graph figure is empty or invalid.")
                 return
+            figure = ax.figure
             
             # For historical graphs, check if data is loaded
             if is_historical:
-                if not self.historical_metrics:
+                if not self._hist_x.size:
                     messagebox.showwarning(
                         "No Data Loaded",
                         "No historical data is currently loaded.\n\n"
@@ -758,8 +1068,7 @@ class ResourceMonitorGUI:
                     return
                 
                 # Check if graph actually has data (has plotted lines)
-                ax = figure.axes[0]
-                if not ax.lines or len(ax.lines) == 0:
+                if not any(len(line.get_xdata()) for line in ax.lines):
                     messagebox.showwarning(
                         "Empty Graph",
                         "The historical graph is empty (no data to display).\n\n"
@@ -808,29 +1117,45 @@ class ResourceMonitorGUI:
                 messagebox.showerror("Error", f"Invalid file path: {e}")
                 return
             
-            # Add timestamp to figure title if not already present
-            current_title = figure.axes[0].get_title()
-            timestamp_str = f" - Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            title_changed = timestamp_str not in current_title
-            if title_changed:
-                figure.axes[0].set_title(current_title + timestamp_str, fontsize=10)
-            
-            # Save the figure with error handling
-            try:
-                figure.savefig(filename, format=format_name, dpi=300, bbox_inches='tight')
-            except Exception as save_error:
-                if title_changed:
-                    figure.axes[0].set_title(current_title)  # Restore title even on error
-                raise save_error
+            # Render a detached copy on the export worker; the timestamp goes
+            # on the copy's title, so the live graph is never modified
+            export_fig = _detached_copy(figure)
+            export_ax = export_fig.axes[figure.axes.index(ax)]
+            export_ax.set_title(
+                f"{export_ax.get_title()} - Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                fontsize=10
+            )
+            self._export_pool.submit(
+                self._write_graph_export, export_ax, filename, format_name,
+                _EXPORT_RESOLUTIONS[self.export_resolution.get()]
+            )
             
-            # Restore original title
-            if title_changed:
-                figure.axes[0].set_title(current_title)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export graph:\n{str(e)}\n\nPlease try again or select a different location.")
+    
+    def _write_graph_export(self, ax: Axes, filename: str, format_name: str, dpi: int):
+        """Save one graph of a detached figure on the export worker and report to Tk.
+        
+        Args:
+            ax: Axes of a figure made by _detached_copy; only this graph is saved.
+            filename: Destination path.
+            format_name: 'jpeg' or 'pdf'.
+            dpi: Resolution of JPEG output; PDF output is vector.
+        """
+        try:
+            figure = ax.figure
+            if format_name == "jpeg":
+                figure.savefig(filename, format=format_name, dpi=dpi,
+                               bbox_inches=_axes_bbox(ax), pil_kwargs=_JPEG_PIL_KWARGS)
+            else:
+                # Vector output; dpi would only scale raster content
+                figure.savefig(filename, format=format_name, bbox_inches=_axes_bbox(ax))
             
             # Verify file was created
             if os.path.exists(filename):
                 file_size = os.path.getsize(filename) / 1024  # Size in KB
-                messagebox.showinfo(
+                self.root.after(
+                    0, messagebox.showinfo,
                     "Success",
                     f"Graph exported successfully!\n\n"
                     f"File: {os.path.basename(filename)}\n"
@@ -838,14 +1163,14 @@ class ResourceMonitorGUI:
                     f"Size: {file_size:.1f} KB"
                 )
             else:
-                messagebox.showwarning("Warning", "Export completed, but file could not be verified.")
+                self.root.after(0, messagebox.showwarning, "Warning", "Export completed, but file could not be verified.")
             
         except PermissionError:
-            messagebox.showerror("Error", f"Permission denied. Cannot write to:\n{filename}\n\nFile may be open in another application.")
+            self.root.after(0, messagebox.showerror, "Error", f"Permission denied. Cannot write to:\n{filename}\n\nFile may be open in another application.")
         except OSError as e:
-            messagebox.showerror("Error", f"File system error:\n{e}\n\nPlease check disk space and permissions.")
+            self.root.after(0, messagebox.showerror, "Error", f"File system error:\n{e}\n\nPlease check disk space and permissions.")
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to export graph:\n{str(e)}\n\nPlease try again or select a different location.")
+            self.root.after(0, messagebox.showerror, "Error", f"Failed to export graph:\n{str(e)}\n\nPlease try again or select a different location.")
     
     def _export_realtime_all_pdf(self):
         """Export all real-time graphs to a single PDF file."""
@@ -864,37 +1189,26 @@ class ResourceMonitorGUI:
             if not filename:
                 return  # User cancelled
             
-            # Create a new figure with all graphs
-            with PdfPages(filename) as pdf:
-                # Save each graph
-                graphs = [
-                    (self.cpu_fig, "CPU Usage"),
-                    (self.memory_fig, "Memory Usage"),
-                    (self.disk_fig, "Disk Usage"),
-                    (self.network_fig, "Network Usage")
-                ]
-                
-                for fig, name in graphs:
-                    # Add export timestamp to title
-                    original_title = fig.axes[0].get_title()
-                    export_title = f"{original_title} - Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                    fig.axes[0].set_title(export_title, fontsize=10)
-                    
-                    # Save to PDF
-                    pdf.savefig(fig, bbox_inches='tight', dpi=300)
-                    
-                    # Restore original title
-                    fig.axes[0].set_title(original_title)
-                
-                # Add metadata
-                d = pdf.infodict()
-                d['Title'] = 'Resource Monitor - Real-Time Graphs'
-                d['Author'] = 'GUI Resource Monitor'
-                d['Subject'] = 'System resource usage graphs'
-                d['Keywords'] = 'CPU, Memory, Disk, Network, Monitoring'
-                d['CreationDate'] = datetime.now()
+            # All four graphs share one figure, saved as a single page. The
+            # export titles go on a detached copy, so the live graphs keep
+            # updating undisturbed while the PDF is written in the background
+            export_fig = _detached_copy(self.rt_fig)
+            export_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            for ax in export_fig.axes:
+                ax.set_title(f"{ax.get_title()} - Exported: {export_time}", fontsize=10)
             
-            messagebox.showinfo("Success", f"All real-time graphs exported successfully to:\n{filename}")
+            info = {
+                'Title': 'Resource Monitor - Real-Time Graphs',
+                'Author': 'GUI Resource Monitor',
+                'Subject': 'System resource usage graphs',
+                'Keywords': 'CPU, Memory, Disk, Network, Monitoring',
+                'CreationDate': datetime.now()
+            }
+            self._export_pool.submit(
+                self._write_pdf_export, filename, [export_fig], info,
+                f"All real-time graphs exported successfully to:\n{filename}",
+                compress=self.compress_pdf.get()
+            )
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export graphs:\n{str(e)}")
@@ -903,7 +1217,7 @@ class ResourceMonitorGUI:
         """Export all historical graphs to a single PDF file."""
         try:
             # Check if historical data is loaded
-            if not self.historical_metrics:
+            if not self._hist_x.size:
                 messagebox.showwarning("Warning", "No historical data loaded. Please load data first.")
                 return
             
@@ -921,232 +1235,335 @@ class ResourceMonitorGUI:
             if not filename:
                 return  # User cancelled
             
-            # Create a new figure with all graphs
-            with PdfPages(filename) as pdf:
-                # Save each graph
-                graphs = [
-                    (self.hist_cpu_fig, "Historical CPU Usage"),
-                    (self.hist_memory_fig, "Historical Memory Usage"),
-                    (self.hist_disk_fig, "Historical Disk Usage"),
-                    (self.hist_network_fig, "Historical Network Usage")
-                ]
-                
-                # Get time range for metadata
-                if self.historical_metrics:
-                    start_time = self.historical_metrics[0].timestamp
-                    end_time = self.historical_metrics[-1].timestamp
-                    time_range_str = f"{start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}"
-                else:
-                    time_range_str = "N/A"
-                
-                for fig, name in graphs:
-                    # Add export timestamp and time range to title
-                    original_title = fig.axes[0].get_title()
-                    export_title = f"{original_title}\nTime Range: {time_range_str}\nExported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-                    fig.axes[0].set_title(export_title, fontsize=9)
-                    
-                    # Save to PDF
-                    pdf.savefig(fig, bbox_inches='tight', dpi=300)
-                    
-                    # Restore original title
-                    fig.axes[0].set_title(original_title)
-                
-                # Add statistics page if available
-                if self.historical_metrics:
-                    stats_fig = Figure(figsize=(8, 6), dpi=100)
-                    stats_ax = stats_fig.add_subplot(111)
-                    stats_ax.axis('off')
-                    
-                    # Calculate statistics
-                    cpu_values = [m.cpu_percent for m in self.historical_metrics]
-                    memory_values = [m.memory_percent for m in self.historical_metrics]
-                    disk_values = [m.disk_percent for m in self.historical_metrics]
-                    network_sent = [m.network_sent_rate_mbps for m in self.historical_metrics]
-                    network_recv = [m.network_recv_rate_mbps for m in self.historical_metrics]
-                    
-                    stats_text = f"Resource Monitor - Historical Data Statistics\n"
-                    stats_text += f"{'='*60}\n\n"
-                    stats_text += f"Time Range: {time_range_str}\n"
-                    stats_text += f"Total Records: {len(self.historical_metrics)}\n"
-                    stats_text += f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    stats_text += f"{'='*60}\n\n"
-                    stats_text += f"CPU Statistics:\n"
-                    stats_text += f"  Average: {sum(cpu_values)/len(cpu_values):.2f}%\n"
-                    stats_text += f"  Minimum: {min(cpu_values):.2f}%\n"
-                    stats_text += f"  Maximum: {max(cpu_values):.2f}%\n\n"
-                    stats_text += f"Memory Statistics:\n"
-                    stats_text += f"  Average: {sum(memory_values)/len(memory_values):.2f}%\n"
-                    stats_text += f"  Minimum: {min(memory_values):.2f}%\n"
-                    stats_text += f"  Maximum: {max(memory_values):.2f}%\n\n"
-                    stats_text += f"Disk Statistics:\n"
-                    stats_text += f"  Average: {sum(disk_values)/len(disk_values):.2f}%\n"
-                    stats_text += f"  Minimum: {min(disk_values):.2f}%\n"
-                    stats_text += f"  Maximum: {max(disk_values):.2f}%\n\n"
-                    stats_text += f"Network Statistics:\n"
-                    stats_text += f"  Sent - Average: {sum(network_sent)/len(network_sent):.2f} Mbps, Max: {max(network_sent):.2f} Mbps\n"
-                    stats_text += f"  Received - Average: {sum(network_recv)/len(network_recv):.2f} Mbps, Max: {max(network_recv):.2f} Mbps\n"
-                    
-                    stats_ax.text(0.1, 0.9, stats_text, transform=stats_ax.transAxes,
-                                 fontsize=10, verticalalignment='top', fontfamily='monospace',
-                                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-                    
-                    pdf.savefig(stats_fig, bbox_inches='tight')
-                
-                # Add metadata
-                d = pdf.infodict()
-                d['Title'] = 'Resource Monitor - Historical Graphs'
-                d['Author'] = 'GUI Resource Monitor'
-                d['Subject'] = 'Historical system resource usage graphs'
-                d['Keywords'] = 'CPU, Memory, Disk, Network, Historical Data, Monitoring'
-                d['CreationDate'] = datetime.now()
+            # Get time range for metadata
+            # Date numbers of naive timestamps convert back to the same wall time
+            start_time, end_time = num2date(self._hist_x[[0, -1]])
+            time_range_str = f"{start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}"
+            export_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
-            messagebox.showinfo("Success", f"All historical graphs exported successfully to:\n{filename}")
+            # One page per graph. Export titles (with time range) go on
+            # detached copies; the live figures are never modified
+            pages = []
+            for fig in (self.hist_cpu_fig, self.hist_memory_fig, self.hist_disk_fig, self.hist_network_fig):
+                export_fig = _detached_copy(fig)
+                ax = export_fig.axes[0]
+                ax.set_title(f"{ax.get_title()}\nTime Range: {time_range_str}\nExported: {export_time}", fontsize=9)
+                pages.append(export_fig)
+            
+            # Add statistics page if available
+            aggregates = self._hist_aggregates
+            stats_text = None
+            if aggregates.get('count'):
+                stats_text = _HIST_PDF_STATS_TEMPLATE.format(
+                    time_range=time_range_str,
+                    export_date=export_time,
+                    **aggregates
+                )
+            
+            info = {
+                'Title': 'Resource Monitor - Historical Graphs',
+                'Author': 'GUI Resource Monitor',
+                'Subject': 'Historical system resource usage graphs',
+                'Keywords': 'CPU, Memory, Disk, Network, Historical Data, Monitoring',
+                'CreationDate': datetime.now()
+            }
+            self._export_pool.submit(
+                self._write_pdf_export, filename, pages, info,
+                f"All historical graphs exported successfully to:\n{filename}",
+                stats_text, self.compress_pdf.get()
+            )
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export graphs:\n{str(e)}")
     
-    def _update_graphs(self, metrics: ResourceMetrics):
-        """Update all graphs with new data - optimized to avoid unnecessary redraws."""
+    def _write_pdf_export(
+        self,
+        filename: str,
+        figures: List[Figure],
+        info: dict,
+        message: str,
+        stats_text: Optional[str] = None,
+        compress: bool = False
+    ):
+        """Write figures to a multi-page PDF on the export worker and report to Tk.
+        
+        The figures must be detached from the GUI (see _detached_copy) or
+        created for the export only; the result is shown on the main thread.
+        The document is rendered into memory and written to disk in one go,
+        so a failed export never leaves a partial file behind.
+        
+        Args:
+            filename: Destination path.
+            figures: Figures to save, one page each.
+            info: PDF document info (Title, Author, ...).
+            message: Message shown when the export succeeds.
+            stats_text: If given, a final statistics page with this text.
+            compress: Recompress the document with Ghostscript. matplotlib's
+                output is kept if that fails.
+        """
         try:
-            # Add new data point
-            self.time_data.append(metrics.timestamp)
-            self.cpu_data.append(metrics.cpu_percent)
-            self.memory_data.append(metrics.memory_percent)
-            self.disk_data.append(metrics.disk_percent)
-            self.network_sent_data.append(metrics.network_sent_rate_mbps)
-            self.network_recv_data.append(metrics.network_recv_rate_mbps)
-            
-            # Keep only last N data points (use deque-like approach for better performance)
-            if len(self.time_data) > self.max_data_points:
-                self.time_data = self.time_data[-self.max_data_points:]
-                self.cpu_data = self.cpu_data[-self.max_data_points:]
-                self.memory_data = self.memory_data[-self.max_data_points:]
-                self.disk_data = self.disk_data[-self.max_data_points:]
-                self.network_sent_data = self.network_sent_data[-self.max_data_points:]
-                self.network_recv_data = self.network_recv_data[-self.max_data_points:]
+            buffer = io.BytesIO()
+            with PdfPages(buffer) as pdf:
+                for figure in figures:
+                    pdf.savefig(figure, bbox_inches='tight')
+                if stats_text is not None:
+                    pdf.savefig(self._stats_page(stats_text), bbox_inches='tight')
+                pdf.infodict().update(info)
+            data = buffer.getvalue()
+            if compress and _GHOSTSCRIPT:
+                try:
+                    data = _compress_pdf(data)
+                except (OSError, subprocess.SubprocessError):
+                    pass  # Keep the uncompressed document
+            with open(filename, 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            self.root.after(0, messagebox.showerror, "Error", f"Failed to export graphs:\n{e}")
+        else:
+            size_kb = len(data) / 1024
+            self.root.after(0, messagebox.showinfo, "Success", f"{message}\n\nSize: {size_kb:.1f} KB")
+    
+    def _stats_page(self, stats_text: str) -> Figure:
+        """Return the PDF statistics page showing stats_text.
+        
+        The page figure is created on first use and only its text changes
+        afterwards. It is only used on the export worker, which runs one
+        export at a time.
+        """
+        if self._stats_fig is None:
+            self._stats_fig = Figure(figsize=(8, 6), dpi=100)
+            stats_ax = self._stats_fig.add_subplot(111)
+            stats_ax.axis('off')
+            self._stats_text = stats_ax.text(0.1, 0.9, '', transform=stats_ax.transAxes,
+                                             fontsize=10, verticalalignment='top', fontfamily='monospace',
+                                             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+        self._stats_text.set_text(stats_text)
+        return self._stats_fig
+    
+    def _update_graphs(self, samples: List[ResourceMetrics], draw: bool = True):
+        """Update all graphs with new data - optimized to avoid unnecessary redraws.
+        
+        Most updates only blit the changed lines over the cached axes
+        background. The full figure (time labels, axis limits) is redrawn
+        while the graphs are filling up, every few updates afterwards, and
+        whenever the network scale changes.
+        
+        Args:
+            samples: New samples since the last update, oldest first.
+            draw: If False, only record the samples; the graphs are hidden
+                and get a full redraw the next time they are drawn.
+        """
+        try:
+            # Add new data points (overwrite the oldest ones once full)
+            for metrics in samples:
+                self._push_graph_sample(metrics)
             
-            # Only update labels periodically to reduce overhead
-            data_length = len(self.time_data)
+            data_length = self._graph_count
             if data_length == 0:
                 return
+            if not draw:
+                self._graphs_stale = True
+                return
+            cpu, memory, disk, sent, recv = self._ordered_graph_data()
             
-            # Format time labels only when needed (every 5 updates or when length changes significantly)
-            update_labels = (data_length % 5 == 0) or (data_length < 10)
-            if update_labels:
-                time_labels = [t.strftime('%H:%M:%S') for t in self.time_data]
-                step = max(1, len(time_labels) // 10)
-            
-            # Update CPU graph
-            indices = list(range(data_length))
-            self.cpu_line.set_data(indices, self.cpu_data)
-            self.cpu_ax.set_xlim(-0.5, data_length - 0.5 if data_length > 1 else 1.5)
-            if update_labels and data_length > 0:
-                self.cpu_ax.set_xticks(indices[::step] if step > 0 else indices)
-                self.cpu_ax.set_xticklabels([time_labels[i] for i in indices[::step] if i < len(time_labels)], rotation=45)
-            self.cpu_canvas.draw_idle()  # Use draw_idle instead of draw for better performance
-            
-            # Update Memory graph
-            self.memory_line.set_data(indices, self.memory_data)
-            self.memory_ax.set_xlim(-0.5, data_length - 0.5 if data_length > 1 else 1.5)
-            if update_labels and data_length > 0:
-                self.memory_ax.set_xticks(indices[::step] if step > 0 else indices)
-                self.memory_ax.set_xticklabels([time_labels[i] for i in indices[::step] if i < len(time_labels)], rotation=45)
-            self.memory_canvas.draw_idle()
+            # Time labels (and the x range) change on every update while the
+            # graphs fill up; once full, refresh them every few updates only
+            self._graph_update_count += 1
+            full_redraw = (data_length < self.max_data_points or self._graphs_stale or
+                           self._graph_update_count % self._label_refresh_every == 0)
+            self._graphs_stale = False
+            indices = np.arange(data_length)
+            if full_redraw:
+                # About ten labels per axis, formatted when their samples
+                # arrived and shared by all four. The x range and tick
+                # positions only move while filling up
+                step = max(1, data_length // 10)
+                oldest = self._graph_head if data_length == self.max_data_points else 0
+                time_labels = [self._graph_labels[(oldest + i) % self.max_data_points]
+                               for i in range(0, data_length, step)]
+                relayout = data_length != self._graph_tick_length
+                self._graph_tick_length = data_length
+                xlim = (-0.5, data_length - 0.5 if data_length > 1 else 1.5)
+                for ax in (self.cpu_ax, self.memory_ax, self.disk_ax, self.network_ax):
+                    if relayout:
+                        ax.set_xlim(xlim)
+                        ax.set_xticks(indices[::step])
+                    ax.set_xticklabels(time_labels)
             
-            # Update Disk graph
-            self.disk_line.set_data(indices, self.disk_data)
-            self.disk_ax.set_xlim(-0.5, data_length - 0.5 if data_length > 1 else 1.5)
-            if update_labels and data_length > 0:
-                self.disk_ax.set_xticks(indices[::step] if step > 0 else indices)
-                self.disk_ax.set_xticklabels([time_labels[i] for i in indices[::step] if i < len(time_labels)], rotation=45)
-            self.disk_canvas.draw_idle()
+            self.cpu_line.set_data(indices, cpu)
+            self.memory_line.set_data(indices, memory)
+            self.disk_line.set_data(indices, disk)
+            self.network_sent_line.set_data(indices, sent)
+            self.network_recv_line.set_data(indices, recv)
             
-            # Update Network graph
-            max_network = max(
-                max(self.network_sent_data) if self.network_sent_data else 0,
-                max(self.network_recv_data) if self.network_recv_data else 0,
-                1
-            )
+            # Network graph scale
+            if self._graph_net_max is None:
+                self._graph_net_max = float(self._graph_data[3:, :data_length].max())
+            max_network = max(self._graph_net_max, 1)
             # Only update ylim if it changed significantly (avoid unnecessary updates)
             current_ylim = self.network_ax.get_ylim()
             new_ylim = (0, max_network * 1.1)
-            if abs(current_ylim[1] - new_ylim[1]) > new_ylim[1] * 0.1:  # 10% change threshold
+            network_rescaled = abs(current_ylim[1] - new_ylim[1]) > new_ylim[1] * 0.1  # 10% change threshold
+            if network_rescaled:
                 self.network_ax.set_ylim(new_ylim)
             
-            self.network_sent_line.set_data(indices, self.network_sent_data)
-            self.network_recv_line.set_data(indices, self.network_recv_data)
-            self.network_ax.set_xlim(-0.5, data_length - 0.5 if data_length > 1 else 1.5)
-            if update_labels and data_length > 0:
-                self.network_ax.set_xticks(indices[::step] if step > 0 else indices)
-                self.network_ax.set_xticklabels([time_labels[i] for i in indices[::step] if i < len(time_labels)], rotation=45)
-            self.network_canvas.draw_idle()
+            if full_redraw or network_rescaled:
+                self.rt_canvas.draw_idle()  # Use draw_idle instead of draw for better performance
+            else:
+                self._blit_realtime()
             
         except Exception as e:
             # Log error but don't crash - just update status
-            self.status_label.config(text=f"Status: Error updating graphs - {str(e)[:50]}")
+            self._status_var.set(f"Status: Error updating graphs - {str(e)[:50]}")
     
-    def _update_statistics(self, metrics: ResourceMetrics):
-        """Update statistics display with current values."""
-        # CPU
-        self.cpu_percent_label.config(text=f"Usage: {metrics.cpu_percent:.2f}%")
-        
-        # Memory
-        self.memory_percent_label.config(text=f"Usage: {metrics.memory_percent:.2f}%")
-        self.memory_details_label.config(
-            text=f"Used: {metrics.memory_used_mb:.0f} MB / Total: {metrics.memory_total_mb:.0f} MB"
-        )
+    def _push_graph_sample(self, metrics: ResourceMetrics):
+        """Write one sample into the real-time ring buffer at the head index.
         
-        # Disk
-        self.disk_percent_label.config(text=f"Usage: {metrics.disk_percent:.2f}%")
-        self.disk_details_label.config(
-            text=f"Used: {metrics.disk_used_gb:.2f} GB / Total: {metrics.disk_total_gb:.2f} GB"
+        Also keeps the running network maximum: a new sample can only raise
+        it, and only evicting the sample that holds it forces a rescan.
+        """
+        net_max = max(metrics.network_sent_rate_mbps, metrics.network_recv_rate_mbps)
+        if self._graph_net_max is not None:
+            if net_max >= self._graph_net_max:
+                self._graph_net_max = net_max
+            elif (self._graph_count == self.max_data_points and
+                  self._graph_data[3:, self._graph_head].max() >= self._graph_net_max):
+                self._graph_net_max = None
+        self._graph_labels[self._graph_head] = metrics.timestamp.strftime('%H:%M:%S')
+        self._graph_data[:, self._graph_head] = (
+            metrics.cpu_percent,
+            metrics.memory_percent,
+            metrics.disk_percent,
+            metrics.network_sent_rate_mbps,
+            metrics.network_recv_rate_mbps
         )
+        self._graph_head = (self._graph_head + 1) % self.max_data_points
+        self._graph_count = min(self._graph_count + 1, self.max_data_points)
+    
+    def _ordered_graph_data(self) -> np.ndarray:
+        """Return the buffered samples oldest first, shape (5, count).
         
-        # Network
-        self.network_sent_label.config(
-            text=f"Sent: {metrics.network_sent_mb:.2f} MB (Rate: {metrics.network_sent_rate_mbps:.2f} Mbps)"
-        )
-        self.network_recv_label.config(
-            text=f"Received: {metrics.network_recv_mb:.2f} MB (Rate: {metrics.network_recv_rate_mbps:.2f} Mbps)"
-        )
+        Before the buffer wraps this is a view; afterwards the two halves are
+        joined into a new array.
+        """
+        if self._graph_count < self.max_data_points:
+            return self._graph_data[:, :self._graph_count]
+        head = self._graph_head
+        return np.concatenate((self._graph_data[:, head:], self._graph_data[:, :head]), axis=1)
+    
+    def _on_realtime_draw(self, event):
+        """Cache each axes background after a full draw and paint the lines on it."""
+        for ax, lines in self._realtime_views:
+            self._blit_backgrounds[ax] = self.rt_canvas.copy_from_bbox(ax.bbox)
+            for line in lines:
+                ax.draw_artist(line)
+    
+    def _blit_realtime(self):
+        """Redraw only the real-time lines over the cached axes backgrounds."""
+        if not self._blit_backgrounds:
+            # Not drawn yet; the full draw will capture the backgrounds
+            self.rt_canvas.draw_idle()
+            return
+        for ax, lines in self._realtime_views:
+            self.rt_canvas.restore_region(self._blit_backgrounds[ax])
+            for line in lines:
+                ax.draw_artist(line)
+        self.rt_canvas.blit(self.rt_fig.bbox)
+    
+    def _update_statistics(self, metrics: ResourceMetrics):
+        """Update statistics display with current values.
         
-        # Timestamp
-        self.timestamp_label.config(
-            text=f"Last Update: {metrics.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
+        A label's text is only formatted when the values it shows changed
+        (totals in particular repeat from one tick to the next), and the
+        label is only reconfigured when the formatted text differs too, since
+        small changes often round to the same display.
+        """
+        fields = (
+            # CPU
+            (self.cpu_percent_label, "Usage: {:.2f}%", (metrics.cpu_percent,)),
+            # Memory
+            (self.memory_percent_label, "Usage: {:.2f}%", (metrics.memory_percent,)),
+            (self.memory_details_label, "Used: {:.0f} MB / Total: {:.0f} MB",
+             (metrics.memory_used_mb, metrics.memory_total_mb)),
+            # Disk
+            (self.disk_percent_label, "Usage: {:.2f}%", (metrics.disk_percent,)),
+            (self.disk_details_label, "Used: {:.2f} GB / Total: {:.2f} GB",
+             (metrics.disk_used_gb, metrics.disk_total_gb)),
+            # Network
+            (self.network_sent_label, "Sent: {:.2f} MB (Rate: {:.2f} Mbps)",
+             (metrics.network_sent_mb, metrics.network_sent_rate_mbps)),
+            (self.network_recv_label, "Received: {:.2f} MB (Rate: {:.2f} Mbps)",
+             (metrics.network_recv_mb, metrics.network_recv_rate_mbps)),
+            # Timestamp
+            (self.timestamp_label, "Last Update: {:%Y-%m-%d %H:%M:%S}", (metrics.timestamp,))
         )
+        shown = self._statistics_values
+        for label, template, values in fields:
+            last = shown.get(label)
+            if last is None or last[0] != values:
+                text = template.format(*values)
+                if last is None or last[1] != text:
+                    label.config(text=text)
+                shown[label] = (values, text)
     
     def _update_gui(self):
-        """Main GUI update loop - called periodically."""
+        """Main GUI update loop - called periodically.
+        
+        Samples are always recorded, but graphs and statistics are only
+        drawn when their tab is showing and the window is not minimized.
+        Ticks without new samples draw nothing, and the time a tick takes is
+        subtracted from the delay to the next one so updates don't drift.
+        """
+        started = time.monotonic()
         try:
-            latest_metrics = self.collector.get_latest_metrics()
+            # Everything collected since the last tick, drawn in one go
+            samples = []
+            try:
+                while True:
+                    samples.append(self._sample_queue.get_nowait())
+            except queue.Empty:
+                pass
             
-            if latest_metrics:
+            if samples:
+                latest_metrics = samples[-1]
+                iconic = self.root.state() == 'iconic'
+                current_tab = self.notebook.index('current')
+                
                 # Update graphs
-                self._update_graphs(latest_metrics)
+                self._update_graphs(samples, draw=not iconic and current_tab == 0)
+                
+                if iconic:
+                    return
                 
                 # Update statistics
-                self._update_statistics(latest_metrics)
+                if current_tab == 1:
+                    self._update_statistics(latest_metrics)
                 
                 # Update status with performance info
                 total_metrics = self.collector.get_history_count()
                 db_stats = self.db_storage.get_statistics()
                 db_count = db_stats.get('total_records', 0)
                 
-                self.status_label.config(
-                    text=f"Status: Running | Memory Metrics: {total_metrics} | "
-                         f"DB Records: {db_count:,} | Graph Points: {len(self.time_data)}/{self.max_data_points}"
+                self._status_var.set(
+                    f"Status: Running | Memory Metrics: {total_metrics} | "
+                    f"DB Records: {db_count:,} | Graph Points: {self._graph_count}/{self.max_data_points}"
                 )
-            else:
-                self.status_label.config(text="Status: Waiting for data...")
+            elif not self._graph_count:
+                self._status_var.set("Status: Waiting for data...")
         except Exception as e:
-            self.status_label.config(text=f"Status: Error - {str(e)[:50]}")
-        
-        # Schedule next update
-        self.root.after(self.update_interval, self._update_gui)
+            self._status_var.set(f"Status: Error - {str(e)[:50]}")
+        finally:
+            # Schedule next update
+            elapsed_ms = int((time.monotonic() - started) * 1000)
+            self.root.after(max(50, self.update_interval - elapsed_ms), self._update_gui)
     
     def on_closing(self):
         """Handle window closing event."""
+        self._export_pool.shutdown(wait=False, cancel_futures=True)
+        self._hist_pool.shutdown(wait=False, cancel_futures=True)
+        self.collector.unsubscribe(self._sample_queue)
         self.collector.stop_collection()
+        self.db_storage.close()
         self.root.destroy()
 
 
@@ -19,6 +19,7 @@ Example:
 """
 
 import time
+import queue
 import threading
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -43,7 +44,19 @@ class ResourceMetrics:
         network_recv_mb (float): Total network data received in megabytes.
         network_sent_rate_mbps (float): Current network send rate in Mbps.
         network_recv_rate_mbps (float): Current network receive rate in Mbps.
+    
+    Note:
+        Instances are kept by the thousand in the collector history, so the
+        class declares __slots__ instead of giving each one a __dict__.
     """
+    __slots__ = (
+        'timestamp', 'cpu_percent', 'memory_percent',
+        'memory_used_mb', 'memory_total_mb',
+        'disk_percent', 'disk_used_gb', 'disk_total_gb',
+        'network_sent_mb', 'network_recv_mb',
+        'network_sent_rate_mbps', 'network_recv_rate_mbps'
+    )
+    
     timestamp: datetime
     cpu_percent: float
     memory_percent: float
@@ -96,14 +109,16 @@ class ResourceCollector:
                 is True. Default is "resource_monitor.db".
         
         Note:
-            Database storage uses batch operations (saves every 10 metrics) to avoid
-            blocking the collection thread.
+            Database storage hands each sample to the storage's writer thread,
+            which commits them in batches, so the collection thread never
+            blocks on disk I/O.
         """
         self.collection_interval = collection_interval
         self.metrics_history: List[ResourceMetrics] = []
         self.is_collecting = False
         self.collection_thread: Optional[threading.Thread] = None
         self.lock = threading.Lock()
+        self._subscribers: List[queue.Queue] = []
         
         # Network counters for rate calculation
         self.last_network_sent = 0.0
@@ -121,9 +136,6 @@ class ResourceCollector:
         if enable_database_storage:
             from data_storage import ResourceDataStorage
             self.db_storage = ResourceDataStorage(db_path)
-            # Batch save settings - save to DB every N metrics to avoid blocking
-            self.db_batch_size = 10
-            self.db_batch_buffer: List[ResourceMetrics] = []
     
     def _get_cpu_usage(self) -> float:
         """Get current CPU usage percentage.
@@ -311,9 +323,9 @@ class ResourceCollector:
         """Internal method that runs in a separate thread to collect metrics periodically.
         
         This method runs continuously while is_collecting is True, collecting metrics
-        at the specified interval. It handles batch database saves automatically if
-        database storage is enabled. The loop sleeps for collection_interval seconds
-        between collections.
+        at the specified interval. If database storage is enabled, each sample is
+        queued for the storage's background writer. The loop sleeps for
+        collection_interval seconds between collections.
         
         Note:
             This is an internal method and should not be called directly. Use
@@ -324,23 +336,67 @@ class ResourceCollector:
             
             with self.lock:
                 self.metrics_history.append(metrics)
-                
-                # Save to database if enabled (batch mode for efficiency)
-                if self.enable_database_storage and self.db_storage:
-                    self.db_batch_buffer.append(metrics)
-                    if len(self.db_batch_buffer) >= self.db_batch_size:
-                        # Save batch without blocking collection
-                        batch_to_save = self.db_batch_buffer.copy()
-                        self.db_batch_buffer.clear()
-                        # Save in background to avoid blocking
-                        threading.Thread(
-                            target=self.db_storage.save_metrics_batch,
-                            args=(batch_to_save,),
-                            daemon=True
-                        ).start()
+                subscribers = self._subscribers
+            
+            for subscriber in subscribers:
+                self._offer(subscriber, metrics)
+            
+            # Queue for the database writer thread (non-blocking)
+            if self.enable_database_storage and self.db_storage:
+                self.db_storage.save_metrics(metrics)
             
             time.sleep(self.collection_interval)
     
+    @staticmethod
+    def _offer(subscriber: queue.Queue, metrics: ResourceMetrics) -> None:
+        """Put metrics on a subscriber queue, dropping its oldest entry if full."""
+        while True:
+            try:
+                subscriber.put_nowait(metrics)
+                return
+            except queue.Full:
+                try:
+                    subscriber.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def subscribe(self, maxsize: int = 64) -> queue.Queue:
+        """Get a queue that receives every metrics snapshot collected from now on.
+        
+        Consumers such as a GUI can drain the queue at their own pace instead
+        of polling get_latest_metrics(), so each sample is seen exactly once
+        however the collection and consumer intervals drift. The collection
+        thread never blocks on a slow consumer: when the queue is full the
+        oldest sample is dropped.
+        
+        Args:
+            maxsize: Maximum number of samples held for the consumer.
+                Default is 64.
+        
+        Returns:
+            queue.Queue: Queue of ResourceMetrics in collection order.
+        
+        Example:
+            >>> samples = collector.subscribe()
+            >>> collector.start_collection()
+            >>> latest = samples.get(timeout=2.0)
+        """
+        subscriber = queue.Queue(maxsize=maxsize)
+        with self.lock:
+            # Replaced rather than appended to, so the collection thread can
+            # iterate its snapshot outside the lock
+            self._subscribers = self._subscribers + [subscriber]
+        return subscriber
+    
+    def unsubscribe(self, subscriber: queue.Queue) -> None:
+        """Stop delivering metrics to a queue returned by subscribe().
+        
+        Args:
+            subscriber: Queue previously returned by subscribe().
+        """
+        with self.lock:
+            self._subscribers = [q for q in self._subscribers if q is not subscriber]
+    
     def start_collection(self) -> None:
         """Start collecting metrics in a background thread.
         
@@ -363,17 +419,16 @@ class ResourceCollector:
         """Stop collecting metrics and save any pending data.
         
         Stops the background collection thread and waits for it to finish
-        (with a 2 second timeout). If database storage is enabled, any remaining
-        buffered metrics are saved before stopping.
+        (with a 2 second timeout). If database storage is enabled, any metrics
+        still queued are written before returning.
         """
         self.is_collecting = False
         if self.collection_thread:
             self.collection_thread.join(timeout=2.0)
         
-        # Save any remaining buffered metrics to database
-        if self.enable_database_storage and self.db_storage and self.db_batch_buffer:
-            self.db_storage.save_metrics_batch(self.db_batch_buffer)
-            self.db_batch_buffer.clear()
+        # Write any metrics still queued for the database
+        if self.enable_database_storage and self.db_storage:
+            self.db_storage.flush()
     
     def save_current_history_to_database(self, db_path: str = "resource_monitor.db") -> int:
         """Save current in-memory history to database.
@@ -406,9 +461,12 @@ class ResourceCollector:
         with self.lock:
             metrics_to_save = self.metrics_history.copy()
         
-        if metrics_to_save:
-            return storage.save_metrics_batch(metrics_to_save)
-        return 0
+        try:
+            if metrics_to_save:
+                return storage.save_metrics_batch(metrics_to_save)
+            return 0
+        finally:
+            storage.close()
     
     def get_latest_metrics(self) -> Optional[ResourceMetrics]:
         """Get the most recent collected metrics.
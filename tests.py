@@ -24,9 +24,13 @@ Usage:
 
 import unittest
 import os
+import sqlite3
 import tempfile
+import threading
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+import data_storage
 from resource_collector import ResourceCollector, ResourceMetrics
 from data_storage import ResourceDataStorage
 
@@ -141,6 +145,25 @@ class TestResourceCollector(unittest.TestCase):
             # Latest should be at least as recent as metrics2
             self.assertGreaterEqual(latest.timestamp, metrics1.timestamp)
     
+    def test_subscribe(self):
+        """Test that subscribers receive each collected sample once."""
+        samples = self.collector.subscribe(maxsize=2)
+        self.collector.start_collection()
+        time.sleep(0.5)
+        self.collector.stop_collection()
+        
+        # Only the newest samples are kept once the queue is full
+        received = [samples.get_nowait() for _ in range(samples.qsize())]
+        self.assertEqual(len(received), 2)
+        self.assertIs(received[-1], self.collector.get_latest_metrics())
+        self.assertLess(received[0].timestamp, received[1].timestamp)
+        
+        self.collector.unsubscribe(samples)
+        self.collector.start_collection()
+        time.sleep(0.2)
+        self.collector.stop_collection()
+        self.assertTrue(samples.empty())
+    
     def test_history_management(self):
         """Test history count and clearing."""
         self.collector.start_collection()
@@ -167,14 +190,42 @@ class TestDataStorage(unittest.TestCase):
     
     def tearDown(self):
         """Clean up temporary database."""
-        if os.path.exists(self.db_path):
-            os.unlink(self.db_path)
+        self.storage.close()
+        for path in (self.db_path, self.db_path + '-wal', self.db_path + '-shm'):
+            if os.path.exists(path):
+                os.unlink(path)
     
     def test_database_initialization(self):
         """Test database initialization."""
         stats = self.storage.get_statistics()
         self.assertEqual(stats['total_records'], 0)
     
+    def test_reader_connections_are_read_only(self):
+        """Test that pooled reader connections cannot modify the database."""
+        with self.storage._get_connection() as conn:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM resource_metrics")
+    
+    def test_reads_do_not_wait_for_writer(self):
+        """Test that queries proceed while the writer connection is busy."""
+        with self.storage._get_connection(write=True) as conn:
+            conn.execute("DELETE FROM resource_metrics")
+            # The writer lock and an open write transaction are both held here
+            self.assertEqual(self.storage.get_metrics_count(), 0)
+            self.assertEqual(self.storage.get_latest_metrics(1), [])
+    
+    def test_wal_journal_mode(self):
+        """Test that the database is switched to WAL journal mode."""
+        with self.storage._get_connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode.lower(), 'wal')
+    
+    def test_new_database_page_size(self):
+        """Test that new databases are created with 8 KiB pages."""
+        with self.storage._get_connection() as conn:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        self.assertEqual(page_size, 8192)
+    
     def test_save_single_metric(self):
         """Test saving a single metric."""
         now = datetime.now()
@@ -227,6 +278,36 @@ class TestDataStorage(unittest.TestCase):
         stats = self.storage.get_statistics()
         self.assertEqual(stats['total_records'], 10)
     
+    def test_bulk_import(self):
+        """Test bulk importing metrics in chunks, skipping stored samples."""
+        base_time = datetime(2024, 1, 1)
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(seconds=i),
+                cpu_percent=float(i % 100),
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=10.0,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(250)
+        ]
+        
+        imported = self.storage.bulk_import(iter(metrics_list[::-1]), chunk_size=100)
+        self.assertEqual(imported, 250)
+        self.assertEqual(self.storage.get_metrics_count(), 250)
+        self.assertEqual(self.storage.get_latest_metrics(1)[0].cpu_percent, 49.0)
+        
+        # Re-importing the same samples adds nothing
+        self.assertEqual(self.storage.bulk_import(metrics_list), 0)
+        self.assertEqual(self.storage.get_metrics_count(), 250)
+    
     def test_retrieve_by_time_range(self):
         """Test retrieving metrics by time range."""
         base_time = datetime.now()
@@ -262,6 +343,226 @@ class TestDataStorage(unittest.TestCase):
             for i in range(len(results) - 1):
                 self.assertLessEqual(results[i].timestamp, results[i+1].timestamp)
     
+    def test_iter_metrics_by_time_range(self):
+        """Test streaming a time range and releasing the reader connection."""
+        base_time = datetime.now()
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(seconds=i),
+                cpu_percent=50.0 + i,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=10.0,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(5)
+        ]
+        self.storage.save_metrics_batch(metrics_list)
+        
+        iterator = self.storage.iter_metrics_by_time_range(limit=3)
+        self.assertEqual(next(iterator).cpu_percent, 50.0)
+        self.assertEqual([m.cpu_percent for m in iterator], [51.0, 52.0])
+        self.assertEqual(self.storage._readers.qsize(), 2)
+    
+    def test_timezone_aware_timestamps(self):
+        """Test that aware timestamps are stored and queried as local time."""
+        local_time = datetime(2026, 1, 9, 10, 0, 0)
+        aware_time = local_time.astimezone(timezone.utc)
+        metrics = ResourceMetrics(
+            timestamp=aware_time,
+            cpu_percent=50.0,
+            memory_percent=60.0,
+            memory_used_mb=8192.0,
+            memory_total_mb=16384.0,
+            disk_percent=75.0,
+            disk_used_gb=500.0,
+            disk_total_gb=1000.0,
+            network_sent_mb=1024.0,
+            network_recv_mb=2048.0,
+            network_sent_rate_mbps=10.0,
+            network_recv_rate_mbps=20.0
+        )
+        self.assertTrue(self.storage.save_metrics(metrics))
+        
+        stored = self.storage.get_metrics_by_time_range(aware_time, aware_time)
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(stored[0].timestamp, local_time)
+    
+    def test_get_metrics_arrays(self):
+        """Test retrieving a time range as columnar arrays."""
+        base_time = datetime.now()
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(seconds=i),
+                cpu_percent=50.0 + i,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=10.0,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(5)
+        ]
+        self.storage.save_metrics_batch(metrics_list)
+        
+        arrays = self.storage.get_metrics_arrays(
+            base_time + timedelta(seconds=1), base_time + timedelta(seconds=3)
+        )
+        self.assertEqual(list(arrays['cpu_percent']), [51.0, 52.0, 53.0])
+        self.assertEqual(
+            arrays['timestamp'][0].astype(datetime), base_time + timedelta(seconds=1)
+        )
+        
+        # newest keeps the most recent records, still in chronological order
+        latest = self.storage.get_metrics_arrays(limit=2, newest=True)
+        self.assertEqual(list(latest['cpu_percent']), [53.0, 54.0])
+        
+        empty = self.storage.get_metrics_arrays(base_time + timedelta(days=1))
+        self.assertEqual(len(empty['timestamp']), 0)
+        self.assertEqual(len(empty['cpu_percent']), 0)
+    
+    def test_get_metrics_numpy(self):
+        """Test retrieving a time range as a structured record array."""
+        base_time = datetime.now()
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(seconds=i),
+                cpu_percent=50.0 + i,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.5,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=10.0,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(3)
+        ]
+        self.storage.save_metrics_batch(metrics_list)
+        
+        records = self.storage.get_metrics_numpy()
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records['cpu_percent'].dtype.name, 'float32')
+        self.assertEqual(list(records['cpu_percent']), [50.0, 51.0, 52.0])
+        self.assertAlmostEqual(float(records['disk_percent'][0]), 75.5, places=4)
+        self.assertEqual(records['timestamp'][2].astype(datetime), metrics_list[2].timestamp)
+        
+        empty = self.storage.get_metrics_numpy(base_time + timedelta(days=1))
+        self.assertEqual(len(empty), 0)
+    
+    def test_get_downsampled(self):
+        """Test bucket averages and maxima across live and archived rows."""
+        base_time = datetime(2026, 1, 9, 10, 0, 0)
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(minutes=15 * i),
+                cpu_percent=10.0 * i,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=0.5,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(8)
+        ]
+        self.storage.save_metrics_batch(metrics_list)
+        self.storage.archive_metrics(base_time + timedelta(hours=1))
+        
+        buckets = self.storage.get_downsampled(
+            base_time, base_time + timedelta(hours=2, microseconds=-1), n_buckets=2
+        )
+        self.assertEqual(buckets['timestamp'][1].astype(datetime), base_time + timedelta(hours=1))
+        self.assertEqual(list(buckets['cpu_percent']), [15.0, 55.0])
+        self.assertEqual(list(buckets['cpu_percent_max']), [30.0, 70.0])
+        self.assertEqual(list(buckets['network_sent_rate_mbps']), [0.5, 0.5])
+        
+        # Fixed-width buckets are aligned to the width, not to start_time
+        buckets = self.storage.get_downsampled(
+            base_time + timedelta(minutes=10), base_time + timedelta(hours=2),
+            bucket=timedelta(minutes=30)
+        )
+        self.assertEqual(buckets['timestamp'][0].astype(datetime), base_time)
+        self.assertEqual(list(buckets['cpu_percent']), [10.0, 25.0, 45.0, 65.0])
+    
+    def test_get_aggregates_by_time_range(self):
+        """Test range aggregates across live and archived rows."""
+        base_time = datetime(2026, 1, 9, 10, 0, 0)
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(minutes=15 * i),
+                cpu_percent=10.0 * i,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=0.5 * i,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(8)
+        ]
+        self.storage.save_metrics_batch(metrics_list)
+        self.storage.archive_metrics(base_time + timedelta(hours=1))
+        
+        aggregates = self.storage.get_aggregates_by_time_range(
+            base_time + timedelta(minutes=30), base_time + timedelta(hours=1, minutes=30)
+        )
+        self.assertEqual(aggregates['count'], 5)
+        self.assertAlmostEqual(aggregates['cpu_percent_avg'], 40.0)
+        self.assertEqual(aggregates['cpu_percent_min'], 20.0)
+        self.assertEqual(aggregates['cpu_percent_max'], 60.0)
+        self.assertEqual(aggregates['network_sent_rate_mbps_max'], 3.0)
+        self.assertEqual(aggregates['memory_percent_avg'], 60.0)
+        
+        # Whole table
+        aggregates = self.storage.get_aggregates_by_time_range()
+        self.assertEqual(aggregates['count'], 8)
+        self.assertEqual(aggregates['cpu_percent_max'], 70.0)
+        
+        # Empty range
+        aggregates = self.storage.get_aggregates_by_time_range(base_time - timedelta(days=1), base_time - timedelta(hours=1))
+        self.assertEqual(aggregates['count'], 0)
+        self.assertIsNone(aggregates['cpu_percent_avg'])
+    
+    def test_range_scan_uses_clustered_key(self):
+        """Test that range scans search the timestamp primary key directly."""
+        arrays = self.storage.get_metrics_arrays(columns=['cpu_percent'])
+        self.assertEqual(set(arrays), {'timestamp', 'cpu_percent'})
+        with self.assertRaises(ValueError):
+            self.storage.get_metrics_arrays(columns=['cpu_percent; DROP TABLE'])
+        
+        query, params = self.storage._build_range_query(
+            "timestamp, cpu_percent, network_recv_rate_mbps",
+            datetime.now() - timedelta(hours=1), datetime.now(), None
+        )
+        with self.storage._get_connection() as conn:
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        detail = " ".join(row[3] for row in plan)
+        self.assertIn("USING PRIMARY KEY", detail)
+        self.assertNotIn("TEMP B-TREE", detail)
+    
     def test_get_latest_metrics(self):
         """Test getting latest metrics."""
         base_time = datetime.now()
@@ -291,6 +592,148 @@ class TestDataStorage(unittest.TestCase):
         self.assertGreaterEqual(latest[-1].timestamp, latest[0].timestamp)
         # Last should be the most recent (5th = base + 4 seconds, since we start at i=0)
         self.assertEqual(latest[-1].timestamp, base_time + timedelta(seconds=4))
+        
+        # Repeated polls reuse the cached result until the next write
+        self.assertIs(self.storage.get_latest_metrics(3)[-1], latest[-1])
+        # A write that stores nothing (duplicate timestamp) keeps the cache
+        self.storage.save_metrics(metrics)
+        self.assertIs(self.storage.get_latest_metrics(3)[-1], latest[-1])
+        metrics.timestamp = base_time + timedelta(seconds=5)
+        self.storage.save_metrics(metrics)
+        self.assertEqual(
+            self.storage.get_latest_metrics(3)[-1].timestamp, base_time + timedelta(seconds=5)
+        )
+    
+    def test_migrates_legacy_text_timestamps(self):
+        """Test that databases with ISO-8601 TEXT timestamps are migrated."""
+        self.storage.close()
+        os.unlink(self.db_path)
+        timestamp = datetime(2026, 1, 9, 14, 30, 0, 123456)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE resource_metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                cpu_percent REAL NOT NULL,
+                memory_percent REAL NOT NULL,
+                memory_used_mb REAL NOT NULL,
+                memory_total_mb REAL NOT NULL,
+                disk_percent REAL NOT NULL,
+                disk_used_gb REAL NOT NULL,
+                disk_total_gb REAL NOT NULL,
+                network_sent_mb REAL NOT NULL,
+                network_recv_mb REAL NOT NULL,
+                network_sent_rate_mbps REAL NOT NULL,
+                network_recv_rate_mbps REAL NOT NULL
+            )
+        """)
+        conn.execute(
+            "INSERT INTO resource_metrics VALUES (NULL, ?, 50, 60, 8192, 16384, 75, 500, 1000, 1024, 2048, 10, 20)",
+            (timestamp.isoformat(),)
+        )
+        conn.commit()
+        conn.close()
+        
+        self.storage = ResourceDataStorage(self.db_path)
+        results = self.storage.get_all_metrics()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].timestamp, timestamp)
+        self.assertEqual(results[0].cpu_percent, 50.0)
+    
+    def test_metrics_stored_as_fixed_point(self):
+        """Test that metric values round-trip at their fixed-point precision."""
+        metrics = ResourceMetrics(
+            timestamp=datetime.now(),
+            cpu_percent=12.3456,
+            memory_percent=60.0,
+            memory_used_mb=8192.125,
+            memory_total_mb=16384.0,
+            disk_percent=75.5,
+            disk_used_gb=500.1234,
+            disk_total_gb=1000.0,
+            network_sent_mb=1024.0,
+            network_recv_mb=2048.0,
+            network_sent_rate_mbps=0.0126,
+            network_recv_rate_mbps=20.0
+        )
+        self.storage.save_metrics_batch([metrics])
+        
+        result = self.storage.get_latest_metrics(1)[0]
+        self.assertEqual(result.cpu_percent, 12.35)
+        self.assertEqual(result.disk_used_gb, 500.123)
+        self.assertEqual(result.network_sent_rate_mbps, 0.013)
+        
+        conn = sqlite3.connect(self.db_path)
+        column_type = conn.execute(
+            "SELECT typeof(cpu_percent) FROM resource_metrics"
+        ).fetchone()[0]
+        conn.close()
+        self.assertEqual(column_type, 'integer')
+    
+    def test_save_metrics_is_buffered(self):
+        """Test that save_metrics buffers records until flushed or queried."""
+        storage = ResourceDataStorage(self.db_path, flush_interval=60.0)
+        try:
+            metrics = ResourceMetrics(
+                timestamp=datetime.now(),
+                cpu_percent=50.0,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=10.0,
+                network_recv_rate_mbps=20.0
+            )
+            self.assertTrue(storage.save_metrics(metrics))
+            self.assertEqual(storage._write_queue.unfinished_tasks, 1)
+            
+            # Queries flush the buffer so saved records are always visible
+            self.assertEqual(storage.get_metrics_count(), 1)
+            self.assertEqual(storage._write_queue.unfinished_tasks, 0)
+            self.assertEqual(storage.flush(), 0)
+        finally:
+            storage.close()
+    
+    def test_close_during_archive_pass(self):
+        """Test that close() stops the writer while it is archiving."""
+        storage = ResourceDataStorage(
+            self.db_path, flush_interval=0.05, archive_after=timedelta(hours=1)
+        )
+        archive_metrics = storage.archive_metrics
+        started = threading.Event()
+        release = threading.Event()
+        
+        def blocked_archive(before_date):
+            started.set()
+            release.wait(5.0)
+            return archive_metrics(before_date)
+        
+        storage.archive_metrics = blocked_archive
+        storage._next_archive = 0.0
+        self.assertTrue(started.wait(5.0))
+        
+        closer = threading.Thread(target=storage.close)
+        closer.start()
+        while not storage._write_queue.qsize():
+            time.sleep(0.01)
+        release.set()
+        closer.join(5.0)
+        self.assertFalse(closer.is_alive())
+        self.assertFalse(storage._writer_thread.is_alive())
+    
+    def test_idle_writer_does_not_write(self):
+        """Test that writer ticks with nothing queued open no transaction."""
+        storage = ResourceDataStorage(self.db_path, flush_interval=0.05)
+        try:
+            generation = storage._count_generation
+            time.sleep(0.3)
+            self.assertEqual(storage._count_generation, generation)
+        finally:
+            storage.close()
     
     def test_get_statistics(self):
         """Test getting database statistics."""
@@ -319,6 +762,243 @@ class TestDataStorage(unittest.TestCase):
         self.assertIsNotNone(stats.get('oldest_timestamp'))
         self.assertIsNotNone(stats.get('newest_timestamp'))
         self.assertGreaterEqual(stats.get('database_size_mb', 0), 0)
+    
+    def test_archive_metrics(self):
+        """Test that archived rows stay visible to every query method."""
+        base_time = datetime(2026, 1, 9, 10, 0, 0)
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(minutes=10 * i),
+                cpu_percent=10.0 + i,
+                memory_percent=60.0,
+                memory_used_mb=8192.5,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.25,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0 + i,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=0.125,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(18)
+        ]
+        self.storage.save_metrics_batch(metrics_list)
+        expected = self.storage.get_all_metrics()
+        
+        # Each hourly bucket is moved in its own write transaction
+        statements = []
+        self.storage._writer.set_trace_callback(statements.append)
+        archived = self.storage.archive_metrics(base_time + timedelta(hours=2, minutes=30))
+        self.storage._writer.set_trace_callback(None)
+        self.assertEqual(archived, 12)
+        self.assertEqual(statements.count("COMMIT"), 3)
+        self.assertEqual(self.storage.get_all_metrics(), expected)
+        self.assertEqual(self.storage.get_metrics_count(), 18)
+        self.assertEqual(self.storage.get_oldest_timestamp(), base_time)
+        self.assertEqual(
+            self.storage.get_metrics_by_time_range(
+                base_time + timedelta(minutes=50), base_time + timedelta(minutes=130)
+            ),
+            expected[5:14]
+        )
+        self.assertEqual(
+            list(self.storage.get_metrics_arrays(limit=3)['cpu_percent']), [10.0, 11.0, 12.0]
+        )
+        self.assertEqual(
+            list(self.storage.get_metrics_arrays(
+                end_time=base_time + timedelta(minutes=70), limit=3, newest=True
+            )['cpu_percent']),
+            [15.0, 16.0, 17.0]
+        )
+        
+        # The cap also bounds what is decoded from the archive
+        with mock.patch.object(
+            data_storage, '_unpack_segment', wraps=data_storage._unpack_segment
+        ) as unpack:
+            arrays = self.storage.get_metrics_arrays(
+                end_time=base_time + timedelta(minutes=110), limit=4, newest=True
+            )
+        self.assertEqual(list(arrays['cpu_percent']), [18.0, 19.0, 20.0, 21.0])
+        self.assertEqual(unpack.call_count, 1)
+        with mock.patch.object(
+            data_storage, '_unpack_segment', wraps=data_storage._unpack_segment
+        ) as unpack:
+            arrays = self.storage.get_metrics_arrays(limit=6, newest=True)
+        self.assertEqual(len(arrays['cpu_percent']), 6)
+        self.assertEqual(unpack.call_count, 0)
+        
+        # Deleting across a segment boundary trims the straddling segment
+        deleted = self.storage.delete_old_metrics(base_time + timedelta(minutes=65))
+        self.assertEqual(deleted, 7)
+        self.assertEqual(self.storage.get_all_metrics(), expected[7:])
+    
+    def test_latest_metrics_decode_newest_archive_segment_only(self):
+        """Test that get_latest_metrics() stops reading the archive at count rows."""
+        base_time = datetime(2026, 1, 9, 10, 0, 0)
+        self.storage.save_metrics_batch([
+            ResourceMetrics(
+                timestamp=base_time + timedelta(minutes=10 * i),
+                cpu_percent=10.0 + i,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=10.0,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(18)
+        ])
+        self.assertEqual(self.storage.archive_metrics(base_time + timedelta(hours=3)), 18)
+        
+        with mock.patch.object(
+            data_storage, '_unpack_segment', wraps=data_storage._unpack_segment
+        ) as unpack:
+            latest = self.storage.get_latest_metrics(3)
+        self.assertEqual([m.cpu_percent for m in latest], [25.0, 26.0, 27.0])
+        self.assertEqual(unpack.call_count, 1)
+    
+    def test_archive_drops_resaved_samples(self):
+        """Test that re-saving archived samples does not duplicate them."""
+        base_time = datetime(2026, 1, 9, 10, 0, 0)
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(minutes=i),
+                cpu_percent=10.0 + i,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=10.0,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(10)
+        ]
+        cutoff = base_time + timedelta(hours=1)
+        self.storage.bulk_import(metrics_list)
+        self.assertEqual(self.storage.archive_metrics(cutoff), 10)
+        
+        # Another writer stores the same samples in the live table again
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.executemany(
+                data_storage._INSERT_SQL, map(data_storage._encode_metrics, metrics_list)
+            )
+        conn.close()
+        self.assertEqual(self.storage.get_metrics_count(), 20)
+        self.storage.archive_metrics(cutoff)
+        self.assertEqual(self.storage.get_metrics_count(), 10)
+        self.assertEqual(self.storage.get_all_metrics(), metrics_list)
+        
+        # The cached count agrees with a fresh count
+        self.storage._adjust_row_count(None)
+        self.assertEqual(self.storage.get_metrics_count(), 10)
+    
+    def test_bulk_import_skips_archived_samples(self):
+        """Test that importing already archived samples inserts nothing."""
+        base_time = datetime(2026, 1, 9, 10, 0, 0)
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(minutes=i),
+                cpu_percent=10.0 + i,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=10.0,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(10)
+        ]
+        self.storage.bulk_import(metrics_list[:6])
+        self.storage.archive_metrics(base_time + timedelta(hours=1))
+        
+        self.assertEqual(self.storage.bulk_import(metrics_list), 4)
+        self.assertEqual(self.storage.save_metrics_batch(metrics_list[:3]), 0)
+        self.assertEqual(self.storage.get_metrics_count(), 10)
+        self.assertEqual(self.storage.get_all_metrics(), metrics_list)
+    
+    def test_metrics_count_is_cached(self):
+        """Test that the cached count follows own writes and external commits."""
+        base_time = datetime(2026, 1, 9, 10, 0, 0)
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(seconds=i),
+                cpu_percent=50.0,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=10.0,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(10)
+        ]
+        self.assertEqual(self.storage.get_metrics_count(), 0)
+        self.storage.save_metrics_batch(metrics_list)
+        self.assertEqual(self.storage._row_count, 10)
+        self.assertEqual(self.storage.get_metrics_count(), 10)
+        self.storage.delete_old_metrics(base_time + timedelta(seconds=3))
+        self.assertEqual(self.storage.get_metrics_count(), 7)
+        
+        # A commit from another connection invalidates the cached count
+        other = ResourceDataStorage(self.db_path)
+        try:
+            other.save_metrics_batch(metrics_list[:3])
+        finally:
+            other.close()
+        self.assertEqual(self.storage.get_metrics_count(), 10)
+    
+    def test_delete_metrics_and_compact(self):
+        """Test deleting old and all metrics without a blocking VACUUM."""
+        base_time = datetime.now()
+        metrics_list = [
+            ResourceMetrics(
+                timestamp=base_time + timedelta(seconds=i),
+                cpu_percent=50.0,
+                memory_percent=60.0,
+                memory_used_mb=8192.0,
+                memory_total_mb=16384.0,
+                disk_percent=75.0,
+                disk_used_gb=500.0,
+                disk_total_gb=1000.0,
+                network_sent_mb=1024.0,
+                network_recv_mb=2048.0,
+                network_sent_rate_mbps=10.0,
+                network_recv_rate_mbps=20.0
+            )
+            for i in range(10)
+        ]
+        self.storage.save_metrics_batch(metrics_list)
+        
+        deleted = self.storage.delete_old_metrics(base_time + timedelta(seconds=4))
+        self.assertEqual(deleted, 4)
+        self.assertEqual(self.storage.get_metrics_count(), 6)
+        self.assertTrue(self.storage.compact(pages=100))
+        
+        self.assertEqual(self.storage.delete_all_metrics(), 6)
+        self.assertEqual(self.storage.get_metrics_count(), 0)
+        
+        self.assertTrue(self.storage.compact())
+        with self.storage._get_connection() as conn:
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        self.assertEqual(auto_vacuum, 2)  # INCREMENTAL
 
 
 class TestIntegration(unittest.TestCase):
@@ -341,8 +1021,9 @@ class TestIntegration(unittest.TestCase):
         if self.collector.is_collecting:
             self.collector.stop_collection()
         
-        if os.path.exists(self.db_path):
-            os.unlink(self.db_path)
+        for path in (self.db_path, self.db_path + '-wal', self.db_path + '-shm'):
+            if os.path.exists(path):
+                os.unlink(path)
     
     def test_collect_and_store_workflow(self):
         """Test collecting metrics and storing them in database."""